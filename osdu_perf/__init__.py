@@ -2,13 +2,17 @@
 OSDU Performance Testing Framework - Core Library
 """
 
-from .operations.base_service import BaseService
-from .operations.service_orchestrator import ServiceOrchestrator
-from .operations.input_handler import InputHandler
-from .operations.auth import AzureTokenManager
-from .utils.environment import detect_environment
-from .operations.init_operation import InitRunner
-from .locust_integration.user import PerformanceUser
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .operations.base_service import BaseService
+    from .operations.service_orchestrator import ServiceOrchestrator
+    from .operations.input_handler import InputHandler
+    from .operations.auth import AzureTokenManager
+    from .utils.environment import detect_environment
+    from .operations.init_operation import InitRunner
+    from .locust_integration.user import PerformanceUser
 
 
 __version__ = "1.0.44"
@@ -18,9 +22,34 @@ __email__ = "janrajcj@microsoft.com"
 __all__ = [
     "InitRunner",
     "BaseService",
-    "ServiceOrchestrator", 
+    "ServiceOrchestrator",
     "InputHandler",
     "AzureTokenManager",
     "PerformanceUser",
     "detect_environment"
 ]
+
+# Public names are imported on first access, so the CLI (and test collection)
+# doesn't load Locust and the Azure SDKs just by importing osdu_perf.
+_LAZY_IMPORTS = {
+    "BaseService": ".operations.base_service",
+    "ServiceOrchestrator": ".operations.service_orchestrator",
+    "InputHandler": ".operations.input_handler",
+    "AzureTokenManager": ".operations.auth",
+    "detect_environment": ".utils.environment",
+    "InitRunner": ".operations.init_operation",
+    "PerformanceUser": ".locust_integration",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,7 @@
 import argparse
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from ..command_base import Command
 from ..argument_mixins import (
     OsduConnectionMixin,
@@ -56,47 +57,55 @@ class AzureLoadTestCommand(
             if not self.validate_args(args):
                 return 1
                 
-            # Existing Azure load test logic here
-            from osdu_perf.operations.azure_test_operation import AzureLoadTestRunner
-            
             config = self._load_azure_configuration(args)
             self._validate_azure_parameters(config)
             self._log_configuration_details(config)
 
             runner = self._create_azure_test_runner(config, args)
+            try:
+                # Create the load test resource
+                load_test = runner.create_load_test_resource()
+                if not load_test:
+                    self.logger.error("❌ Failed to create Azure Load Test resource")
+                    return 1
+                
+                if not self._create_tests_and_upload(runner, config, args):
+                    return 1
+
+                # Entitlements are only granted once the test is in place. They need
+                # nothing from the initialization wait, so they run during it.
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    entitlements = executor.submit(
+                        self._setup_azure_entitlements, runner, config, runner.load_test_name
+                    )
+                    self._wait_for_test_initialization()
+                    entitlements.result()
 
-            # Create the load test resource
-            load_test = runner.create_load_test_resource()
-            if not load_test:
-                self.logger.error("❌ Failed to create Azure Load Test resource")
-                return 1
-            
-            # Continue with existing workflow...
-            test_directory = getattr(args, 'directory', './perf_tests')
-            setup_success = runner.create_tests_and_upload_test_files(
-                test_name=config['test_name'],
-                test_directory=test_directory,
-                host=config['host'],
-                partition=config['partition'],
-                app_id=config['app_id'],
-                users=config['users'],
-                spawn_rate=config['spawn_rate'],
-                run_time=config['run_time'],
-                engine_instances=config['engine_instances'],
-                tags=config['tags'],
-                adme_token = config['osdu_adme_token'],
-                test_description = config.get('test_description', '')
-            )
-            
-            if setup_success:
-                self._setup_azure_entitlements(runner, config, runner.load_test_name)
                 self._execute_load_test(runner, config)
                 return 0
-            else:
-                return 1
+            finally:
+                runner.close()
                 
         except Exception as e:
             return self.handle_error(e)
+
+    def _create_tests_and_upload(self, runner, config, args) -> bool:
+        """Create the Azure Load Test definition and upload the test files."""
+        test_directory = getattr(args, 'directory', './perf_tests')
+        return runner.create_tests_and_upload_test_files(
+            test_name=config['test_name'],
+            test_directory=test_directory,
+            host=config['host'],
+            partition=config['partition'],
+            app_id=config['app_id'],
+            users=config['users'],
+            spawn_rate=config['spawn_rate'],
+            run_time=config['run_time'],
+            engine_instances=config['engine_instances'],
+            tags=config['tags'],
+            adme_token = config['osdu_adme_token'],
+            test_description = config.get('test_description', '')
+        )
         
     
     def _load_azure_configuration(self, args):
@@ -251,13 +260,14 @@ class AzureLoadTestCommand(
             self.logger.warning("📝 You may need to setup entitlements manually")
 
 
-    def _execute_load_test(self, runner, config):
-        """Execute the Azure Load Test."""
-        # Wait for Azure Load Test to initialize
+    def _wait_for_test_initialization(self):
+        """Wait for the Azure Load Test to initialize after upload."""
         initialization_wait_time = 360  # 6 minutes
         self.logger.info(f"STEP 4 Waiting {initialization_wait_time} seconds for Azure Load Test to initialize...")
         time.sleep(initialization_wait_time)
 
+    def _execute_load_test(self, runner, config):
+        """Execute the Azure Load Test."""
         # Trigger the load test execution
         self.logger.info("STEP 4 Starting load test execution...")
         try:
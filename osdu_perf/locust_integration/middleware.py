@@ -33,22 +33,33 @@ _MAX_HEADER_LEN = 128
 _original_request = None
 
 
-def _get_test_name_prefix():
-    """Get test_name_prefix from PerformanceUser's InputHandler (lazy import to avoid circular)."""
-    from .user import PerformanceUser
-    ih = PerformanceUser._input_handler_instance
-    if ih:
-        return ih.get_test_name_prefix()
-    return "osdu_perf_test"
-
-
 def _get_input_handler():
     """Get InputHandler instance from PerformanceUser (lazy import to avoid circular)."""
     from .user import PerformanceUser
     return PerformanceUser._input_handler_instance
 
 
-def _ensure_authorization(headers):
+# (input_handler, test_name_prefix) resolved for the current InputHandler.
+# get_test_name_prefix() merges the test settings on every call, so it is
+# computed once per handler rather than once per request.
+_prefix_cache = (None, None)
+
+
+def _get_test_name_prefix(ih=None):
+    """Get test_name_prefix for the given (or current) InputHandler, memoized per handler."""
+    global _prefix_cache
+    if ih is None:
+        ih = _get_input_handler()
+    if not ih:
+        return "osdu_perf_test"
+    cached_ih, cached_prefix = _prefix_cache
+    if cached_ih is not ih:
+        cached_prefix = ih.get_test_name_prefix()
+        _prefix_cache = (ih, cached_prefix)
+    return cached_prefix
+
+
+def _ensure_authorization(headers, ih=None):
     """Fill Authorization header if missing. Re-reads ADME_BEARER_TOKEN for freshness."""
     if "Authorization" in headers:
         return
@@ -56,16 +67,18 @@ def _ensure_authorization(headers):
     if token:
         headers["Authorization"] = f"Bearer {token}"
         return
-    ih = _get_input_handler()
+    if ih is None:
+        ih = _get_input_handler()
     if ih and ih.header and "Authorization" in ih.header:
         headers["Authorization"] = ih.header["Authorization"]
 
 
-def _ensure_partition(headers):
+def _ensure_partition(headers, ih=None):
     """Fill data-partition-id header if missing."""
     if "data-partition-id" in headers:
         return
-    ih = _get_input_handler()
+    if ih is None:
+        ih = _get_input_handler()
     if ih and ih.partition:
         headers["data-partition-id"] = ih.partition
 
@@ -83,15 +96,18 @@ def _intercepted_request(self, method, url, **kwargs):
         headers = {}
         kwargs["headers"] = headers
 
+    # Resolve the InputHandler once per request and share it with the helpers
+    ih = _get_input_handler()
+
     # --- Fill missing standard headers ---
-    _ensure_authorization(headers)
-    _ensure_partition(headers)
+    _ensure_authorization(headers, ih)
+    _ensure_partition(headers, ih)
     _ensure_content_type(headers)
 
     # --- Per-request correlation-id ---
 
     test_run_id = headers.get("correlation-id", "")
-    prefix = _get_test_name_prefix()
+    prefix = _get_test_name_prefix(ih)
 
     # The headers dict is shared across requests, so correlation-id may
     # already contain appended per-request IDs from a previous call.
@@ -2,8 +2,8 @@
 from locust import HttpUser, task, events, between
 from ..operations.service_orchestrator import ServiceOrchestrator
 from ..operations.input_handler import   InputHandler
+from ..telemetry import naming
 import logging
-from urllib.parse import urlparse
 import os
 import uuid
 from datetime import datetime
@@ -37,17 +37,31 @@ class PerformanceUser():
         return logger
     
 
-    def __init__(self, environment):
+    def __init__(self, environment, client=None):
+        """
+        Args:
+            environment: Locust environment
+            client: The owning Locust user's ``self.client``. Its session keeps
+                pooled keep-alive connections per host, so get/post/put/delete
+                reuse TCP+TLS connections instead of handshaking per request.
+        """
         self.environment = environment
+        self.client = client
         self.input_handler = None
         self.logger = self._setup_logging()
 
-        self.logger.info(f"PerformanceUser on_start called environment is {self.environment}")
+        self.logger.info("PerformanceUser on_start called environment is %s", self.environment)
         self.input_handler = InputHandler(self.environment)
         
-        # Store config at class level for access in static methods
-        PerformanceUser._kusto_config = self.input_handler.get_kusto_config()
+        # Store config at class level for access in static methods.
+        # The Kusto config is process-wide, so resolve it once rather than per spawned user.
+        if PerformanceUser._kusto_config is None:
+            PerformanceUser._kusto_config = self.input_handler.get_kusto_config()
         PerformanceUser._input_handler_instance = self.input_handler      
+
+        # Resolve per-request values once instead of on every request
+        self._base_url = self.input_handler.base_url
+        self._base_header = self.input_handler.header
  
     def get_host(self):
         """Return the host URL for this user"""
@@ -73,50 +87,50 @@ class PerformanceUser():
         return self.logger
     
     def get(self, endpoint, name=None, headers=None, **kwargs):
-        return self._request("GET", f"{self.input_handler.base_url}{endpoint}", name, headers, **kwargs)
+        return self._request("GET", f"{self._base_url}{endpoint}", name, headers, **kwargs)
 
     def post(self, endpoint, data=None, name=None, headers=None, **kwargs):
-        return self._request("POST", f"{self.input_handler.base_url}{endpoint}", name, headers, json=data, **kwargs)
+        return self._request("POST", f"{self._base_url}{endpoint}", name, headers, json=data, **kwargs)
 
     def put(self, endpoint, data=None, name=None, headers=None, **kwargs):
-        return self._request("PUT", f"{self.input_handler.base_url}{endpoint}", name, headers, json=data, **kwargs)
+        return self._request("PUT", f"{self._base_url}{endpoint}", name, headers, json=data, **kwargs)
 
     def delete(self, endpoint, name=None, headers=None, **kwargs):
-        return self._request("DELETE", f"{self.input_handler.base_url}{endpoint}", name, headers, **kwargs)
+        return self._request("DELETE", f"{self._base_url}{endpoint}", name, headers, **kwargs)
 
     def _request(self, method, url, name, headers, **kwargs):
-        self.logger.info(f"[PerformanceUser] Making {method} request to {url} with name={name} ")   
-        merged_headers = dict(self.input_handler.header)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"[PerformanceUser] Making {method} request to {url} with name={name} ")
+        # Per-request copy: the middleware fills and rewrites headers in place,
+        # so the InputHandler's shared header dict must never be passed through.
+        merged_headers = dict(self._base_header)
         token = os.getenv("ADME_BEARER_TOKEN", None)
         if token:
             self.logger.debug("[PerformanceUser] Using ADME_BEARER_TOKEN from environment for Authorization header")
             merged_headers['Authorization'] = f"Bearer {token}"
         if headers:
-            self.logger.debug(f"[PerformanceUser] Merging additional headers: {headers}")   
+            if debug:
+                self.logger.debug(f"[PerformanceUser] Merging additional headers: {headers}")
             merged_headers.update(headers)
 
         with self.client.request(method=method,url=url,headers=merged_headers,name=name,catch_response=True,**kwargs) as response:
             if not response.ok:
-                self.logger.error(f"[PerformanceUser] {method} {url} failed with status code {response.status_code}")   
+                # Lazy %-formatting: only rendered if the record is actually emitted
+                self.logger.error("[PerformanceUser] %s %s failed with status code %s", method, url, response.status_code)
                 response.failure(f"{method} {url} failed with {response.status_code}")
-            self.logger.debug(f"[PerformanceUser] {method} {url} succeeded with status code {response.status_code}")
+            elif debug:
+                self.logger.debug(f"[PerformanceUser] {method} {url} succeeded with status code {response.status_code}")
   
     @staticmethod
     def get_ADME_name(host):
         """Return the ADME name for this user class"""
-        try:
-            parsed = urlparse(host)
-            return parsed.hostname or parsed.netloc.split(':')[0]
-        except Exception:
-            return "unknown"
+        return naming.get_adme_name(host)
+
     @staticmethod
     def get_service_name(url_path):
         """Return the Service name for this user class"""
-        try:
-            parsed = urlparse(url_path)
-            return parsed.path.split('/')[2] or "unknown"
-        except Exception:
-            return "unknown"
+        return naming.get_service_name(url_path)
 
     @events.test_stop.add_listener
     def on_test_stop(environment, **kwargs):
@@ -1,11 +1,15 @@
 # osdu_perf/operations/__init__.py
 """Operations for OSDU Performance Testing Framework"""
 
-from .base_service import BaseService
-from .service_orchestrator import ServiceOrchestrator
-from .azure_test_operation import AzureLoadTestRunner
-from .local_test_operation import LocalTestRunner
-from .init_operation import InitRunner
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_service import BaseService
+    from .service_orchestrator import ServiceOrchestrator
+    from .azure_test_operation import AzureLoadTestRunner
+    from .local_test_operation import LocalTestRunner
+    from .init_operation import InitRunner
 
 __all__ = [
     "BaseService",
@@ -14,3 +18,26 @@ __all__ = [
     "LocalTestRunner",
     "InitRunner"
 ]
+
+# Imported on first access (see osdu_perf/__init__.py), so importing one
+# operations submodule doesn't load the Azure runner and its SDKs.
+_LAZY_IMPORTS = {
+    "BaseService": ".base_service",
+    "ServiceOrchestrator": ".service_orchestrator",
+    "AzureLoadTestRunner": ".azure_test_operation",
+    "LocalTestRunner": ".local_test_operation",
+    "InitRunner": ".init_operation",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,9 @@
 import json
+import time
 import logging
 import subprocess
 from abc import ABC, abstractmethod
 from typing import Optional
-from azure.identity import AzureCliCredential, ManagedIdentityCredential
 
 
 class AuthenticationStrategy(ABC):
@@ -24,6 +24,7 @@ class AzureCliStrategy(AuthenticationStrategy):
     """Authentication strategy using Azure CLI credentials."""
     
     def __init__(self):
+        from azure.identity import AzureCliCredential
         self.credential = AzureCliCredential()
         self.logger = logging.getLogger(__name__)
         self._cached_tokens = {}
@@ -88,6 +89,7 @@ class ManagedIdentityStrategy(AuthenticationStrategy):
     """Authentication strategy using Managed Identity credentials."""
     
     def __init__(self, client_id: Optional[str] = None):
+        from azure.identity import ManagedIdentityCredential
         self.credential = ManagedIdentityCredential(client_id=client_id)
         self.client_id = client_id
         self.logger = logging.getLogger(__name__)
@@ -141,6 +143,37 @@ class InputTokenStrategy(AuthenticationStrategy):
     def get_strategy_name(self) -> str:
         return "Input Token"
     
+class TokenCachingCredential:
+    """
+    azure-core TokenCredential wrapper that reuses access tokens until they near expiry.
+
+    AzureCliCredential has no token cache of its own, so every SDK client
+    built on it shells out to ``az`` for a fresh token. Sharing one wrapped
+    credential across clients means each scope is fetched once per token
+    lifetime.
+    """
+
+    REFRESH_MARGIN_SECONDS = 300
+
+    def __init__(self, credential):
+        self._credential = credential
+        self._tokens = {}
+
+    def get_token(self, *scopes, **kwargs):
+        """Return a cached AccessToken for the scopes, refreshing within 5 minutes of expiry."""
+        key = (scopes, tuple(sorted(kwargs.items())))
+        token = self._tokens.get(key)
+        if token is None or token.expires_on - time.time() < self.REFRESH_MARGIN_SECONDS:
+            token = self._credential.get_token(*scopes, **kwargs)
+            self._tokens[key] = token
+        return token
+
+    def close(self) -> None:
+        close = getattr(self._credential, "close", None)
+        if close:
+            close()
+
+
 class AzureTokenManager:
     """
     Simplified Azure token manager using Strategy Pattern.
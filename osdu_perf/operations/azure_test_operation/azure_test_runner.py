@@ -15,10 +15,6 @@ import urllib.request
 import urllib.error
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-from azure.identity import AzureCliCredential
-from azure.mgmt.resource import ResourceManagementClient
-from azure.mgmt.loadtesting import LoadTestMgmtClient
-from azure.developer.loadtesting import LoadTestAdministrationClient, LoadTestRunClient
 
 # Handle both relative imports (when used as module) and direct imports (when run as script)
 try:
@@ -27,12 +23,16 @@ try:
     from .file_manager import AzureLoadTestFileManager
     from .test_executor import AzureLoadTestExecutor
     from .entitlement_manager import AzureLoadTestEntitlementManager
+    from .transport import create_pooled_session, transport_kwargs
+    from ..auth import TokenCachingCredential
 except ImportError:
     from resource_manager import AzureLoadTestResourceManager
     from config import AzureLoadTestConfig
     from file_manager import AzureLoadTestFileManager
     from test_executor import AzureLoadTestExecutor
     from entitlement_manager import AzureLoadTestEntitlementManager
+    from transport import create_pooled_session, transport_kwargs
+    from osdu_perf.operations.auth import TokenCachingCredential
 
 
 class UrllibResponse:
@@ -64,6 +64,9 @@ class AzureLoadTestRunner:
     Interface Segregation: Clear, focused public interface
     Dependency Inversion: Depends on Azure REST API abstractions
     """
+
+    # Token-caching credentials keyed by subscription id, shared by every runner in the process
+    _credential_cache: Dict[str, TokenCachingCredential] = {}
     
     def __init__(self, 
                  subscription_id: str,
@@ -88,8 +91,8 @@ class AzureLoadTestRunner:
         # Initialize logger first
         self._setup_logging()
         
-        # Initialize Azure credential
-        self._credential = AzureCliCredential()
+        # Initialize Azure credential (shared per subscription across runner instances)
+        self._credential = self._get_cached_credential(subscription_id)
         
         # Create configuration object
         self.config = AzureLoadTestConfig(
@@ -118,6 +121,9 @@ class AzureLoadTestRunner:
         # Initialize Azure SDK clients (will be set after resource creation)
         self.loadtest_admin_client = None
         self.loadtest_run_client = None
+
+        # One pooled HTTP session shared by every SDK client to avoid repeated TLS handshakes
+        self._http_session = create_pooled_session()
         
         # Initialize Resource Manager for resource lifecycle operations
         self.resource_manager = AzureLoadTestResourceManager(
@@ -127,7 +133,9 @@ class AzureLoadTestRunner:
             location=self.config.location,
             credential=self._credential,
             tags=self.config.tags,
-            logger=self.logger
+            logger=self.logger,
+            http_session=self._http_session,
+            poll_interval=self.config.lro_poll_interval
         )
         
         # Log initialization
@@ -137,6 +145,16 @@ class AzureLoadTestRunner:
         self.logger.info(f"Load Test Name: {self.load_test_name}")
         self.logger.info(f"Location: {self.location}")
 
+    def close(self) -> None:
+        """Close the pooled HTTP session shared by the SDK clients."""
+        self._http_session.close()
+
+    def __enter__(self) -> "AzureLoadTestRunner":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _setup_logging(self) -> None:
         """Setup logging configuration."""
         self.logger = logging.getLogger(f"osdu_perf.{self.__class__.__name__}")
@@ -188,30 +206,39 @@ class AzureLoadTestRunner:
             self.logger.warning(f"Unknown time unit '{unit}', defaulting to 60 seconds")
             return 60
     
-    def _initialize_credential(self) -> AzureCliCredential:
-        """Initialize Azure CLI credential."""
-        try:
-            credential = AzureCliCredential()
-            self.logger.info("✅ Azure CLI credential initialized successfully")
-            return credential
-        except Exception as e:
-            self.logger.error(f"❌ Failed to initialize Azure CLI credential: {e}")
-            raise
-    
+    @classmethod
+    def _get_cached_credential(cls, subscription_id: str) -> TokenCachingCredential:
+        """Return the token-caching Azure CLI credential for a subscription, creating it once."""
+        credential = cls._credential_cache.get(subscription_id)
+        if credential is None:
+            from azure.identity import AzureCliCredential
+            credential = TokenCachingCredential(AzureCliCredential())
+            cls._credential_cache[subscription_id] = credential
+        return credential
+
+    @classmethod
+    def clear_credential_cache(cls) -> None:
+        """Drop the shared credentials, e.g. after switching the Azure CLI login."""
+        cls._credential_cache.clear()
+
     def _init_data_plane_client(self, data_plane_uri: str, principal_id: str) -> None:
         """Initialize the data plane client after resource creation."""
         self.principal_id = principal_id
         try:
             if data_plane_uri:
+                from azure.developer.loadtesting import LoadTestAdministrationClient, LoadTestRunClient
+
                 # Initialize Load Testing Clients for data plane operations
                 self.loadtest_admin_client = LoadTestAdministrationClient(
                     endpoint=data_plane_uri,
-                    credential=self._credential
+                    credential=self._credential,
+                    **transport_kwargs(self._http_session)
                 )
                 
                 self.loadtest_run_client = LoadTestRunClient(
                     endpoint=data_plane_uri,
-                    credential=self._credential
+                    credential=self._credential,
+                    **transport_kwargs(self._http_session)
                 )
 
                 self.logger.info(f"Data plane clients initialized: {data_plane_uri}")
@@ -226,7 +253,8 @@ class AzureLoadTestRunner:
                 self.file_manager = AzureLoadTestFileManager(
                     loadtest_admin_client=self.loadtest_admin_client,
                     api_version=self.config.api_version,
-                    logger=self.logger
+                    logger=self.logger,
+                    compress_uploads=self.config.compress_uploads
                 )
                 
                 self.test_executor = AzureLoadTestExecutor(
@@ -488,8 +516,6 @@ class AzureLoadTestRunner:
         Returns:
             bool: True if setup completed successfully
         """
-        import os
-        
         try:
             # Verify file_manager is initialized
             if not hasattr(self, 'file_manager') or not self.file_manager:
@@ -504,12 +530,13 @@ class AzureLoadTestRunner:
             excluded_files = []
             
             for file_path in test_files:
-                file_name = os.path.basename(file_path)
-                if any(config_name in file_name.lower() for config_name in config_files_to_exclude):
-                    excluded_files.append(file_name)
+                path_object = Path(file_path)
+                if any(config_name in path_object.name.lower() for config_name in config_files_to_exclude):
+                    excluded_files.append(path_object.name)
                 else:
-                    filtered_test_files.append(file_path)
+                    filtered_test_files.append(path_object)
             
+            # Path objects are built once here and reused for create/upload
             test_files = filtered_test_files
             
             if excluded_files:
@@ -527,13 +554,9 @@ class AzureLoadTestRunner:
             self.logger.info(f"Found {len(test_files)} performance test files")
             self.logger.info("Files to upload to Azure Load Testing:")
             for test_file in test_files:
-                file_name = os.path.basename(test_file)
-                self.logger.info(f"   • {file_name}")
+                self.logger.info(f"   • {test_file.name}")
             self.logger.info("")
             
-            # Convert file paths to Path objects for the new workflow
-            path_objects = [Path(f) for f in test_files]
-            
             # Create the test with files using the new Azure Load Testing workflow
             self.logger.info("")
             self.logger.info(f"🧪 Creating test '{test_name}' with files and OSDU configuration...")
@@ -552,7 +575,7 @@ class AzureLoadTestRunner:
             
             test_result = self.create_test(
                 test_name=test_name, 
-                test_files=path_objects,
+                test_files=test_files,
                 host=host,
                 partition=partition, 
                 app_id=app_id,
@@ -574,7 +597,7 @@ class AzureLoadTestRunner:
             
             # Upload test files using file_manager (delegates to AzureLoadTestFileManager)
             self.logger.info(f"📤 Uploading {len(test_files)} test files using File Manager...")
-            uploaded_files = self.file_manager.upload_files_for_test(test_name, path_objects)
+            uploaded_files = self.file_manager.upload_files_for_test(test_name, test_files)
             
             if uploaded_files:
                 self.logger.info(f"✅ Successfully uploaded {len(uploaded_files)} files")
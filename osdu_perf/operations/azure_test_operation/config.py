@@ -1,5 +1,6 @@
 """Configuration management for Azure Load Test Runner."""
 
+import os
 from typing import Dict, Optional
 from dataclasses import dataclass, field
 
@@ -26,6 +27,16 @@ class AzureLoadTestConfig:
     # API Configuration
     management_base_url: str = "https://management.azure.com"
     api_version: str = "2024-12-01-preview"
+    # Seconds between long-running-operation polls (SDK default honours Retry-After, often 30s+)
+    lro_poll_interval: int = field(
+        default_factory=lambda: int(os.environ.get("OSDU_LRO_POLL_INTERVAL", "2"))
+    )
+    
+    # Upload Configuration
+    # gzip large text test files on upload (opt-in: service support is undocumented)
+    compress_uploads: bool = field(
+        default_factory=lambda: os.environ.get("OSDU_COMPRESS_UPLOADS", "").lower() == "true"
+    )
     
     # Data Plane Configuration (set after resource creation)
     data_plane_url: Optional[str] = None
@@ -57,6 +68,8 @@ class AzureLoadTestConfig:
             "version": self.version,
             "test_runid_name": self.test_runid_name,
             "api_version": self.api_version,
+            "lro_poll_interval": self.lro_poll_interval,
+            "compress_uploads": self.compress_uploads,
             "data_plane_url": self.data_plane_url,
             "principal_id": self.principal_id
         }
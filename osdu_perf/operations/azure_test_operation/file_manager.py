@@ -2,10 +2,27 @@
 
 import logging
 import os
-import glob
-from typing import List, Dict, Any, Optional
+import re
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from pathlib import Path
-from azure.developer.loadtesting import LoadTestAdministrationClient
+from azure.core.exceptions import HttpResponseError
+
+if TYPE_CHECKING:
+    from azure.developer.loadtesting import LoadTestAdministrationClient
+
+# Text artifacts worth gzip-compressing on upload, and the size below which
+# compression isn't worth the CPU.
+COMPRESSIBLE_SUFFIXES = ('.py', '.json', '.csv', '.txt')
+COMPRESSION_MIN_BYTES = 4 * 1024
+
+# Files picked up from the test directory: *.py, perf_*.json and requirements.txt
+# (hidden files are skipped, as glob did)
+_TEST_FILE_RE = re.compile(r'^(?:[^.].*\.py|perf_.*\.json|requirements\.txt)$')
+
+# Upper bound on concurrent artifact uploads to the data plane
+MAX_PARALLEL_UPLOADS = 4
 
 
 class AzureLoadTestFileManager:
@@ -13,9 +30,10 @@ class AzureLoadTestFileManager:
     
     def __init__(
         self,
-        loadtest_admin_client: LoadTestAdministrationClient,
+        loadtest_admin_client: "LoadTestAdministrationClient",
         api_version: str = "2024-12-01-preview",
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        compress_uploads: bool = False
     ):
         """
         Initialize the file manager.
@@ -24,10 +42,12 @@ class AzureLoadTestFileManager:
             loadtest_admin_client: Azure Load Test Administration client for file operations
             api_version: API version to use
             logger: Logger instance
+            compress_uploads: Send large text files with Content-Encoding: gzip
         """
         self.loadtest_admin_client = loadtest_admin_client
         self.api_version = api_version
         self.logger = logger or logging.getLogger(__name__)
+        self.compress_uploads = compress_uploads
     
     def upload_files_for_test(
         self,
@@ -47,46 +67,108 @@ class AzureLoadTestFileManager:
         uploaded_files = []
         self.logger.info(f"Uploading {len(test_files)} files to test '{test_name}'...")
         
-        # Sort so locustfile.py (JMX_FILE) is uploaded last per Azure Load Testing recommendation
-        test_files = sorted(test_files, key=lambda f: f.name.lower() == 'locustfile.py')
+        existing_files = []
+        for file_path in test_files:
+            if not file_path.exists():
+                self.logger.warning(f"File does not exist: {file_path}")
+                continue
+            existing_files.append(file_path)
+
+        # JMX_FILE: Main test script (locustfile.py), uploaded last per Azure Load Testing recommendation
+        # ADDITIONAL_ARTIFACTS: Supporting files (requirements.txt, utilities, perf.*test.py)
+        artifacts = [f for f in existing_files if f.name.lower() != 'locustfile.py']
+        main_scripts = [f for f in existing_files if f.name.lower() == 'locustfile.py']
         
         try:
-            for file_path in test_files:
-                if not file_path.exists():
-                    self.logger.warning(f"File does not exist: {file_path}")
-                    continue
-
-                self.logger.info(f"Uploading file: {file_path.name}")
+            # Artifacts are independent, so their uploads (and the service-side
+            # validation each waits on) run concurrently.
+            if len(artifacts) > 1:
+                max_workers = min(MAX_PARALLEL_UPLOADS, len(artifacts))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(self._upload_entry, test_name, path, "ADDITIONAL_ARTIFACTS")
+                        for path in artifacts
+                    ]
+                # Report every artifact that made it, then surface the first failure
+                # so the main script is not uploaded without its dependencies.
+                errors = []
+                for future in futures:
+                    exc = future.exception()
+                    if exc is not None:
+                        errors.append(exc)
+                    else:
+                        uploaded_files.append(future.result())
+                if errors:
+                    raise errors[0]
+            else:
+                for file_path in artifacts:
+                    uploaded_files.append(self._upload_entry(test_name, file_path, "ADDITIONAL_ARTIFACTS"))
 
-                # Determine file type
-                # JMX_FILE: Main test scripts (locustfile.py)
-                # ADDITIONAL_ARTIFACTS: Supporting files (requirements.txt, utilities, perf.*test.py)
-                if file_path.name.lower() == 'locustfile.py':
-                    file_type = "JMX_FILE"
-                else:
-                    file_type = "ADDITIONAL_ARTIFACTS"
-                
-                # Upload file
-                with open(file_path, 'rb') as file_content:
-                    result = self.loadtest_admin_client.begin_upload_test_file(
-                        test_id=test_name,
-                        file_name=file_path.name,
-                        file_type=file_type,
-                        body=file_content
-                    ).result()  # Wait for upload to complete
-                
-                uploaded_files.append({
-                    'fileName': file_path.name,
-                    'fileType': file_type,
-                    'result': result
-                })
-                
-                self.logger.info(f"✅ Successfully uploaded: {file_path.name} as {file_type}")
+            for file_path in main_scripts:
+                uploaded_files.append(self._upload_entry(test_name, file_path, "JMX_FILE"))
                 
         except Exception as e:
             self.logger.error(f"❌ Error uploading files: {e}")
 
         return uploaded_files
+
+    def _upload_entry(self, test_name: str, file_path: Path, file_type: str) -> Dict[str, Any]:
+        """Upload one file and return its upload record."""
+        self.logger.info(f"Uploading file: {file_path.name}")
+        result = self._upload_file(test_name, file_path, file_type)
+        self.logger.info(f"✅ Successfully uploaded: {file_path.name} as {file_type}")
+        return {
+            'fileName': file_path.name,
+            'fileType': file_type,
+            'result': result
+        }
+
+    def _should_compress(self, file_path: Path) -> bool:
+        """Return True if the file is a text artifact large enough to gzip."""
+        return (
+            self.compress_uploads
+            and file_path.name.lower().endswith(COMPRESSIBLE_SUFFIXES)
+            and file_path.stat().st_size > COMPRESSION_MIN_BYTES
+        )
+
+    def _upload_file(self, test_name: str, file_path: Path, file_type: str) -> Any:
+        """
+        Upload a single file, gzip-compressed when enabled and worthwhile.
+        
+        Falls back to an uncompressed upload if the service rejects the
+        encoding with 415 Unsupported Media Type.
+        
+        Args:
+            test_name: Name of the test
+            file_path: File to upload
+            file_type: JMX_FILE or ADDITIONAL_ARTIFACTS
+            
+        Returns:
+            Any: Result of the upload poller
+        """
+        if self._should_compress(file_path):
+            # Level 3: test artifacts are small text files, higher levels cost CPU for little gain
+            body = gzip.compress(file_path.read_bytes(), compresslevel=3)
+            try:
+                return self.loadtest_admin_client.begin_upload_test_file(
+                    test_id=test_name,
+                    file_name=file_path.name,
+                    file_type=file_type,
+                    body=body,
+                    headers={'Content-Encoding': 'gzip'}
+                ).result()  # Wait for upload to complete
+            except HttpResponseError as e:
+                if e.status_code != 415:
+                    raise
+                self.logger.info(f"gzip upload not accepted for {file_path.name}, retrying uncompressed")
+
+        with open(file_path, 'rb') as file_content:
+            return self.loadtest_admin_client.begin_upload_test_file(
+                test_id=test_name,
+                file_name=file_path.name,
+                file_type=file_type,
+                body=file_content
+            ).result()  # Wait for upload to complete
     
     def find_test_files(
         self,
@@ -104,26 +186,22 @@ class AzureLoadTestFileManager:
         try:
             self.logger.info(f"Searching for test files in: {test_directory}")
             
-            # Search patterns: all .py files in the test directory (non-recursive), plus JSON configs and requirements
-            search_patterns = [
-                os.path.join(test_directory, "*.py"),
-                os.path.join(test_directory, "perf_*.json"),
-                os.path.join(test_directory, "requirements.txt")
-            ]
-            
+            # One non-recursive directory scan matched against a single compiled pattern:
+            # all .py files, perf_*.json configs and requirements.txt
             test_files = []
-            for pattern in search_patterns:
-                found_files = glob.glob(pattern, recursive=True)
-                test_files.extend(found_files)
+            has_locustfile = False
+            if os.path.isdir(test_directory):
+                with os.scandir(test_directory) as entries:
+                    for entry in entries:
+                        if _TEST_FILE_RE.match(entry.name) and entry.is_file():
+                            test_files.append(entry.path)
+                            has_locustfile = has_locustfile or entry.name == 'locustfile.py'
+                test_files.sort()
             
             # If no locustfile.py found, look for OSDU library version
-            has_locustfile = any('locustfile.py' in f for f in test_files)
             if not has_locustfile:
                 test_files.extend(self._find_osdu_locustfile())
             
-            # Remove duplicates
-            test_files = list(set(test_files))
-            
             if test_files:
                 self.logger.info(f"Found {len(test_files)} test file(s):")
                 for file_path in test_files:
@@ -2,8 +2,8 @@
 
 import logging
 from typing import Dict, Any, Optional
-from azure.mgmt.resource import ResourceManagementClient
-from azure.mgmt.loadtesting import LoadTestMgmtClient
+
+from .transport import transport_kwargs
 
 
 class AzureLoadTestResourceManager:
@@ -17,9 +17,16 @@ class AzureLoadTestResourceManager:
         location: str,
         credential: Any,
         tags: Optional[Dict[str, str]] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        http_session: Optional[Any] = None,
+        poll_interval: int = 2
     ):
-        """Initialize the resource manager."""
+        """Initialize the resource manager.
+
+        http_session, when given, is a pooled requests.Session shared with the
+        other SDK clients so ARM calls reuse TCP/TLS connections.
+        poll_interval is the seconds between polls of long-running operations.
+        """
         self.subscription_id = subscription_id
         self.resource_group_name = resource_group_name
         self.load_test_name = load_test_name
@@ -27,6 +34,8 @@ class AzureLoadTestResourceManager:
         self.credential = credential
         self.tags = tags or {"Environment": "Performance Testing", "Service": "OSDU"}
         self.logger = logger or logging.getLogger(__name__)
+        self.http_session = http_session
+        self.poll_interval = poll_interval
         
         # Initialize SDK clients
         self._init_clients()
@@ -35,17 +44,22 @@ class AzureLoadTestResourceManager:
     
     def _init_clients(self) -> None:
         """Initialize Azure SDK clients."""
+        from azure.mgmt.resource import ResourceManagementClient
+        from azure.mgmt.loadtesting import LoadTestMgmtClient
+
         try:
             # Resource Management Client for resource group operations
             self.resource_client = ResourceManagementClient(
                 credential=self.credential,
-                subscription_id=self.subscription_id
+                subscription_id=self.subscription_id,
+                **transport_kwargs(self.http_session)
             )
             
             # Load Test Management Client for resource operations
             self.loadtest_mgmt_client = LoadTestMgmtClient(
                 credential=self.credential,
-                subscription_id=self.subscription_id
+                subscription_id=self.subscription_id,
+                **transport_kwargs(self.http_session)
             )
 
             self.logger.info(f"Azure SDK clients initialized successfully {self.subscription_id}")
@@ -132,7 +146,8 @@ class AzureLoadTestResourceManager:
                 create_operation = self.loadtest_mgmt_client.load_tests.begin_create_or_update(
                     resource_group_name=self.resource_group_name,
                     load_test_name=self.load_test_name,
-                    load_test_resource=load_test_data
+                    load_test_resource=load_test_data,
+                    polling_interval=self.poll_interval
                 )
                 
                 # Wait for creation to complete
@@ -2,8 +2,10 @@
 
 import logging
 import time
-from typing import Dict, Any, Optional
-from azure.developer.loadtesting import LoadTestRunClient
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    from azure.developer.loadtesting import LoadTestRunClient
 
 
 class AzureLoadTestExecutor:
@@ -11,7 +13,7 @@ class AzureLoadTestExecutor:
     
     def __init__(
         self,
-        loadtest_run_client: LoadTestRunClient,
+        loadtest_run_client: "LoadTestRunClient",
         logger: Optional[logging.Logger] = None
     ):
         """
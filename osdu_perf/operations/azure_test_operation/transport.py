@@ -0,0 +1,27 @@
+"""Shared HTTP connection pooling for Azure SDK clients."""
+
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_pooled_session(pool_connections: int = 4, pool_maxsize: int = 16) -> requests.Session:
+    """Create a requests.Session whose HTTPS pool is shared by every SDK client built on it."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    return session
+
+
+def transport_kwargs(session: Optional[requests.Session]) -> Dict[str, Any]:
+    """
+    Return SDK client kwargs that route requests through the shared session.
+
+    Each client gets its own RequestsTransport (session_owner=False) so closing
+    one client never closes the pooled session used by the others.
+    """
+    if session is None:
+        return {}
+    from azure.core.pipeline.transport import RequestsTransport
+    return {"transport": RequestsTransport(session=session, session_owner=False)}
@@ -2,13 +2,19 @@ from abc import ABC, abstractmethod
 
 class BaseService(ABC):
     """Base class for all service classes that need HTTP client access"""
+
+    # Subclasses that also declare __slots__ get instances without a per-object __dict__
+    __slots__ = ('client',)
     
     def __init__(self, client=None):
         """
         Initialize with HTTP client.
         
         Args:
-            client: HTTP client (typically Locust's self.client or requests)
+            client: HTTP client (typically Locust's self.client or requests).
+                Prefer the Locust user's self.client: it is a pooled session
+                that reuses keep-alive connections and is instrumented by the
+                osdu_perf request middleware.
         """
         self.client = client
     
@@ -53,4 +59,4 @@ class BaseService(ABC):
             partition: Data partition ID  
             host: Host URL for the service
         """
-        raise NotImplementedError("Subclasses must implement posthook() method")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement posthook() method")
@@ -409,7 +409,8 @@ class OSDUUser(HttpUser):
         # into every outgoing request. You do NOT need to pass headers manually.
         # Just write your tests — the framework handles the rest. if there is special case, you can add that alone in the header
 
-        self.config_obj = PerformanceUser(self.environment)
+        # Pass self.client so helper requests share this user's pooled keep-alive session
+        self.config_obj = PerformanceUser(self.environment, client=self.client)
         self.partition = self.config_obj.get_partition()
         self.host = self.config_obj.get_host()
         self.headers = self.config_obj.get_headers()
@@ -1,16 +1,70 @@
 import os
 import logging
+import functools
 import yaml
 import subprocess
 import json
+import time
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-from datetime import datetime
 
 from .auth import AzureTokenManager
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_azure_load_test_environment() -> bool:
+    """
+    Detect if we're running in Azure Load Testing environment.
+
+    Environment variables don't change after process start, so the result is
+    computed (and logged) once per process instead of once per InputHandler.
+
+    Returns:
+        bool: True if running in Azure Load Testing, False if local development
+    """
+    logger = logging.getLogger("osdu_perf.InputHandler")
+    logger.info(f"Detecting Platform: AZURE_LOAD_TEST={os.getenv('AZURE_LOAD_TEST')}, PARTITION={os.getenv('PARTITION')}, LOCUST_HOST={os.getenv('LOCUST_HOST')}, APPID={os.getenv('APPID')}")
+
+    # Check if any Azure Load Testing indicators are present
+    if os.getenv("AZURE_LOAD_TEST") == "true":
+        logger.info(f"Detected Azure Load Testing environment")
+        return True
+
+    if os.getenv("LOCUST_HOST", None) is not None:
+        logger.info(f"Detected Azure Load Testing environment via LOCUST_HOST, PARTITION, APPID")
+        return True
+
+    if os.getenv("LOCUST_USERS", None) is not None:
+        logger.info(f"Detected Azure Load Testing environment via LOCUST_USERS")
+        return True
+
+    if os.getenv("LOCUST_RUN_TIME", None) is not None:
+        logger.info(f"Detected Azure Load Testing environment via LOCUST_RUN_TIME")
+        return True
+
+    if os.getenv("LOCUST_SPAWN_RATE", None) is not None:
+        logger.info(f"Detected Azure Load Testing environment via LOCUST_SPAWN_RATE")
+        return True
+
+    logger.info("Detected local development environment")
+    return False
+
+
+@functools.lru_cache(maxsize=8)
+def _format_second(fmt: str, second: int, utc: bool) -> str:
+    return time.strftime(fmt, time.gmtime(second) if utc else time.localtime(second))
+
+
+def _timestamp(fmt: str, utc: bool = False) -> str:
+    """Return the current time formatted with ``fmt``, formatted at most once per second."""
+    return _format_second(fmt, int(time.time()), utc)
+
+
 class InputHandler:
+    # Clock seam for run names/ids (wraps the module-level _timestamp);
+    # tests stub it through the class or the instance
+    _clock = staticmethod(_timestamp)
+
     def __init__(self, environment):
         # Setup logging - use osdu_perf namespace so it inherits root logger config
         self.logger = logging.getLogger(f"osdu_perf.{self.__class__.__name__}")
@@ -124,31 +178,7 @@ class InputHandler:
         Returns:
             bool: True if running in Azure Load Testing, False if local development
         """
-        self.logger.info(f"Detecting Platform: AZURE_LOAD_TEST={os.getenv('AZURE_LOAD_TEST')}, PARTITION={os.getenv('PARTITION')}, LOCUST_HOST={os.getenv('LOCUST_HOST')}, APPID={os.getenv('APPID')}")
-
-        # Check if any Azure Load Testing indicators are present
-        if os.getenv("AZURE_LOAD_TEST") == "true":
-            self.logger.info(f"Detected Azure Load Testing environment")
-            return True
-
-        if os.getenv("LOCUST_HOST", None) is not None:
-            self.logger.info(f"Detected Azure Load Testing environment via LOCUST_HOST, PARTITION, APPID")
-            return True
-
-        if os.getenv("LOCUST_USERS", None) is not None:
-            self.logger.info(f"Detected Azure Load Testing environment via LOCUST_USERS")
-            return True
-        
-        if os.getenv("LOCUST_RUN_TIME", None) is not None:
-            self.logger.info(f"Detected Azure Load Testing environment via LOCUST_RUN_TIME")
-            return True
-        
-        if os.getenv("LOCUST_SPAWN_RATE", None) is not None:
-            self.logger.info(f"Detected Azure Load Testing environment via LOCUST_SPAWN_RATE")
-            return True
-        
-        self.logger.info("Detected local development environment")
-        return False
+        return _detect_azure_load_test_environment()
     
     def get_token_for_control_path(self, app_id: str) -> Optional[str]:
         """
@@ -372,7 +402,7 @@ class InputHandler:
         test_run_id = os.getenv("TEST_RUN_ID_NAME", None) or os.getenv("TEST_RUN_ID", None)
         self.logger.info(f"Retrieved Test Run ID from environment: os.getenv('TEST_RUN_ID')={os.getenv('TEST_RUN_ID')}, os.getenv('TEST_RUN_ID_NAME')={os.getenv('TEST_RUN_ID_NAME')}")
         if test_run_id is None:
-            test_run_id = self.get_test_run_id_prefix() + "-" + datetime.utcnow().strftime("%Y%m%d%H%M%S")
+            test_run_id = self.get_test_run_id_prefix() + "-" + self._clock("%Y%m%d%H%M%S", utc=True)
 
         headers = {
             "Content-Type": "application/json",
@@ -855,7 +885,7 @@ class InputHandler:
         """
 
         max_length = 50  # Maximum length for the test run name
-        timestamp = datetime.now().strftime('%m%d_%H%M%S')  # Shorter timestamp
+        timestamp = self._clock('%m%d_%H%M%S')  # Shorter timestamp
         max_base_length = max_length - len(f"{timestamp}")
         return f"{test_name[:max_base_length]}-{timestamp}"
 
@@ -901,7 +931,7 @@ class InputHandler:
         self.logger.info(f"Generated test name: {test_name}")
         
         # Generate test run ID: prefix[_tier_version]_timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self._clock("%Y%m%d_%H%M%S")
         run_suffix_parts = [
             str(p).strip().replace(".", "_")
             for p in [performance_tier, version]
@@ -60,6 +60,9 @@ class LocalTestRunner:
     - Executing Locust commands with proper configuration
     """
     
+    # Process seam for the locust invocation; tests can assign a stub on the instance
+    _run = staticmethod(subprocess.run)
+    
     def __init__(self, logger=None):
         """
         Initialize the LocalTestRunner.
@@ -340,7 +343,7 @@ class LocalTestRunner:
         """
         self.logger.info("⚡ Executing locust command...")
         try:
-            result = subprocess.run(command, capture_output=False, text=True, env=env)
+            result = self._run(command, capture_output=False, text=True, env=env)
             return result.returncode
         except FileNotFoundError:
             self.logger.error("❌ Locust is not installed. Install it with: pip install locust")
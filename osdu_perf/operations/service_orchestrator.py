@@ -1,7 +1,20 @@
 import os
+import re
 import importlib.util
 import inspect
+from typing import Optional
 from .base_service import BaseService
+
+# perf_<service>_test.py; like the startswith/endswith check it replaces,
+# it also accepts the bare perf_test.py (which has no service name)
+_PERF_TEST_RE = re.compile(r'^perf(?:_(.*))?_test\.py$')
+
+
+def _parse_service_name(file_name: str) -> Optional[str]:
+    """Return <service> from a perf_<service>_test.py file name, or None if it has none."""
+    match = _PERF_TEST_RE.match(file_name)
+    return (match.group(1) or None) if match else None
+
     
 class ServiceOrchestrator():
 
@@ -69,8 +82,7 @@ class ServiceOrchestrator():
         current_folder = os.getcwd()
 
         # Get all Python files matching perf_*_test.py pattern in current directory
-        test_files = [f for f in os.listdir(current_folder)
-                     if f.startswith('perf_') and f.endswith('_test.py')]
+        test_files = [f for f in os.listdir(current_folder) if _PERF_TEST_RE.match(f)]
 
         if not test_files:
             print(f"No perf_*_test.py files found in {current_folder}")
@@ -4,9 +4,9 @@ import os
 import uuid
 import logging
 from datetime import datetime
-from urllib.parse import urlparse
 from typing import List
 
+from .naming import get_adme_name, get_service_name
 from .plugin_base import TelemetryPlugin
 from .report import (
     TestReport, TestMetadata, EndpointStat,
@@ -16,22 +16,6 @@ from .report import (
 logger = logging.getLogger(__name__)
 
 
-def _get_adme_name(host: str) -> str:
-    try:
-        parsed = urlparse(host)
-        return parsed.hostname or parsed.netloc.split(':')[0]
-    except Exception:
-        return "unknown"
-
-
-def _get_service_name(url_path: str) -> str:
-    try:
-        parsed = urlparse(url_path)
-        return parsed.path.split('/')[2] or "unknown"
-    except Exception:
-        return "unknown"
-
-
 def _safe_float(obj, attr, default=0.0):
     val = getattr(obj, attr, None)
     return float(val) if val is not None else default
@@ -79,6 +63,10 @@ class TelemetryDispatcher:
             logger.info("No telemetry plugins enabled, skipping metrics push")
             return
 
+        if not self._has_requests(environment):
+            logger.info("No requests recorded (run aborted or empty), skipping metrics push")
+            return
+
         plugin_names = [p.name() for p in self._plugins]
         logger.info(f"Enabled plugins: {plugin_names}")
 
@@ -115,12 +103,48 @@ class TelemetryDispatcher:
         else:
             logger.info("All plugins completed successfully")
 
+    @staticmethod
+    def _has_requests(environment) -> bool:
+        """Return False when the run recorded nothing, so plugins aren't set up for an empty report."""
+        try:
+            stats = environment.runner.stats
+            return bool(stats.entries) and stats.total.num_requests > 0
+        except AttributeError:
+            # Let _build_report surface a malformed environment as before
+            return True
+
     # ------------------------------------------------------------------
     # Report building — migrated from PerformanceUser.on_test_stop
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _resolve_run_metadata(input_handler) -> tuple:
+        """Return (partition, performance_tier, version, test_scenario) for the report.
+
+        Values come from the InputHandler, with the Azure Load Test env vars
+        acting as overrides exactly as on the CLI. The environment is only
+        used as the source when there is no InputHandler, with "Unknown" for
+        variables that are not set. A variable set to an empty string is
+        passed through unchanged.
+        """
+        if input_handler:
+            return (
+                input_handler.partition,
+                input_handler.get_osdu_performance_tier(os.getenv("PERFORMANCE_TIER", os.getenv("SKU", None))),
+                input_handler.get_osdu_version(os.getenv("VERSION", None)),
+                input_handler.get_test_scenario(os.getenv("LOCUST_TAGS", None)),
+            )
+        return (
+            os.getenv("PARTITION", "Unknown"),
+            os.getenv("PERFORMANCE_TIER", os.getenv("SKU", "Unknown")),
+            os.getenv("VERSION", "Unknown"),
+            os.getenv("LOCUST_TAGS", "Unknown"),
+        )
+
     def _build_report(self, environment, input_handler) -> TestReport:
+        # One timestamp (and its ISO form) represents the test-stop moment for every row
         current_timestamp = datetime.utcnow()
+        current_iso = current_timestamp.isoformat()
 
         # Metadata
         test_run_id = os.getenv("TEST_RUN_ID_NAME") or os.getenv("TEST_RUN_ID")
@@ -131,20 +155,8 @@ class TelemetryDispatcher:
         is_azure = os.getenv("AZURE_LOAD_TEST", "").lower() == "true"
         test_run_environment = "Azure Load Test" if is_azure else "Local"
 
-        adme = _get_adme_name(environment.host)
-        partition = input_handler.partition if input_handler else os.getenv("PARTITION", "Unknown")
-        performance_tier = (
-            input_handler.get_osdu_performance_tier(os.getenv("PERFORMANCE_TIER", os.getenv("SKU", None)))
-            if input_handler else os.getenv("PERFORMANCE_TIER", os.getenv("SKU", "Unknown"))
-        )
-        version = (
-            input_handler.get_osdu_version(os.getenv("VERSION", None))
-            if input_handler else os.getenv("VERSION", "Unknown")
-        )
-        test_scenario = (
-            input_handler.get_test_scenario(os.getenv("LOCUST_TAGS", None))
-            if input_handler else os.getenv("LOCUST_TAGS", "Unknown")
-        )
+        adme = get_adme_name(environment.host)
+        partition, performance_tier, version, test_scenario = self._resolve_run_metadata(input_handler)
 
         stats = environment.runner.stats
         start_time = getattr(environment.runner, 'start_time', None)
@@ -175,19 +187,19 @@ class TelemetryDispatcher:
         # Endpoint stats
         endpoint_stats = []
         for entry in stats.entries.values():
-            service = _get_service_name(entry.name)
-            entry_start = (
-                datetime.fromtimestamp(entry.start_time).isoformat()
-                if hasattr(entry, 'start_time') and entry.start_time is not None
-                else current_timestamp.isoformat()
+            service = get_service_name(entry.name)
+            start_dt = (
+                datetime.fromtimestamp(entry.start_time)
+                if getattr(entry, 'start_time', None) is not None
+                else current_timestamp
             )
-            entry_end = (
-                datetime.fromtimestamp(entry.last_request_timestamp).isoformat()
-                if hasattr(entry, 'last_request_timestamp') and entry.last_request_timestamp is not None
-                else current_timestamp.isoformat()
+            end_dt = (
+                datetime.fromtimestamp(entry.last_request_timestamp)
+                if getattr(entry, 'last_request_timestamp', None) is not None
+                else current_timestamp
             )
-            start_dt = datetime.fromisoformat(entry_start.replace("Z", "+00:00"))
-            end_dt = datetime.fromisoformat(entry_end.replace("Z", "+00:00"))
+            entry_start = start_dt.isoformat()
+            entry_end = end_dt.isoformat()
             duration = (end_dt - start_dt).total_seconds()
             throughput = (entry.total_content_length / duration) if duration > 0 else 0
             average_rps = (entry.num_requests / duration) if duration > 0 else 0
@@ -222,11 +234,12 @@ class TelemetryDispatcher:
 
         # Exceptions
         exceptions = []
-        for _key, error_entry in stats.errors.items():
+        for error_entry in stats.errors.values():
+            error_name = str(error_entry.name)
             exceptions.append(ExceptionRecord(
                 method=str(error_entry.method),
-                name=str(error_entry.name),
-                service=_get_service_name(str(error_entry.name)),
+                name=error_name,
+                service=get_service_name(error_name),
                 error=str(error_entry.error) if hasattr(error_entry, 'error') else "Unknown",
                 occurrences=int(error_entry.occurrences) if hasattr(error_entry, 'occurrences') else 0,
                 traceback=str(getattr(error_entry, 'traceback', '')),
@@ -255,8 +268,8 @@ class TelemetryDispatcher:
             fail_ratio=_safe_float(stats.total, 'fail_ratio'),
             avg_content_length=_safe_float(stats.total, 'avg_content_length'),
             total_content_length=_safe_int(stats.total, 'total_content_length'),
-            start_time=start_time.isoformat() if start_time and hasattr(start_time, 'isoformat') else current_timestamp.isoformat(),
-            end_time=current_timestamp.isoformat(),
+            start_time=start_time.isoformat() if start_time and hasattr(start_time, 'isoformat') else current_iso,
+            end_time=current_iso,
             test_duration_seconds=float(test_duration),
             average_rps=float(total_avg_rps),
             throughput=total_throughput,
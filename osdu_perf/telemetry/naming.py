@@ -0,0 +1,38 @@
+"""Host and service name parsing shared by the telemetry report and PerformanceUser."""
+
+import functools
+from urllib.parse import urlparse
+
+
+@functools.lru_cache(maxsize=16)
+def get_adme_name(host: str) -> str:
+    """Return the ADME host name (without port) from the Locust host URL."""
+    try:
+        parsed = urlparse(host)
+        return parsed.hostname or parsed.netloc.split(':')[0]
+    except Exception:
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=1024)
+def get_service_name(url_path: str) -> str:
+    """Return <service> from '/api/<service>/...' using plain string splits.
+
+    Called for every stats entry and error, so plain paths avoid urlparse and
+    the result is memoized — the same path repeats across methods (GET/POST)
+    and errors. Anything else (full URLs, '//host' forms) still goes through
+    urlparse so the result never differs from it.
+    """
+    try:
+        if url_path.startswith("/") and not url_path.startswith("//"):
+            path = url_path.split("#", 1)[0].split("?", 1)[0]
+        else:
+            path = urlparse(url_path).path
+        parts = path.split("/", 3)
+        service = parts[2]
+        if len(parts) == 3:
+            # urlparse strips ';params' from the last path segment only
+            service = service.split(";", 1)[0]
+        return service or "unknown"
+    except Exception:
+        return "unknown"
@@ -3,8 +3,11 @@
 import io
 import os
 import csv
+import gzip
+import tempfile
 import time
 import logging
+import functools
 from urllib.parse import urlparse
 
 from ..plugin_base import TelemetryPlugin
@@ -106,15 +109,57 @@ def _build_create_merge_kql(table_name, schema):
     return f".create-merge table {table_name} ({col_defs})"
 
 
-def _create_csv_string(data_list, columns):
-    """Serialize a list of row dicts to a CSV string with the given column order."""
-    if not data_list:
-        return ""
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=columns)
-    writer.writeheader()
-    writer.writerows(data_list)
-    return output.getvalue()
+def _write_csv_rows(output, data_list, columns):
+    """Write a header plus row dicts to a text stream in the given column order.
+
+    Rows are written with a plain csv.writer instead of csv.DictWriter, which
+    re-validates every row's keys against the header. Missing keys become
+    empty cells, as with DictWriter.
+    """
+    writer = csv.writer(output)
+    writer.writerow(columns)
+    writer.writerows(tuple(row.get(col, "") for col in columns) for row in data_list)
+
+
+def _create_gzip_csv_file(data_list, columns):
+    """Stream row dicts into a gzip-compressed CSV temp file and return its path.
+
+    Rows are written straight through the compressor, so peak memory stays
+    flat instead of holding the full CSV text and its compressed copy. Each
+    table becomes one large blob, which is what Kusto ingests most efficiently.
+    The caller is responsible for deleting the file.
+    """
+    fd, path = tempfile.mkstemp(prefix="osdu_perf_", suffix=".csv.gz")
+    try:
+        # Large write buffer + fast compression level: DEFLATE emits many small
+        # writes, and the gzip default (9) spends CPU for little size gain on CSV.
+        with os.fdopen(fd, "wb", buffering=1024 * 1024) as raw, \
+                gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=3) as gz, \
+                io.TextIOWrapper(gz, encoding="utf-8", newline="") as text:
+            _write_csv_rows(text, data_list, columns)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _get_kusto_clients(cluster: str, ingest_uri: str, use_managed_identity: bool):
+    """Build (management kcsb, QueuedIngestClient) once per cluster and auth mode.
+
+    Cached at module level so repeated test stops in the same process reuse
+    the authenticated ingest client instead of re-creating it every time.
+    """
+    from azure.kusto.ingest import QueuedIngestClient
+    from azure.kusto.data import KustoConnectionStringBuilder
+
+    if use_managed_identity:
+        kcsb_mgmt = KustoConnectionStringBuilder.with_aad_managed_service_identity_authentication(cluster)
+        kcsb_ingest = KustoConnectionStringBuilder.with_aad_managed_service_identity_authentication(ingest_uri)
+    else:
+        kcsb_mgmt = KustoConnectionStringBuilder.with_az_cli_authentication(cluster)
+        kcsb_ingest = KustoConnectionStringBuilder.with_az_cli_authentication(ingest_uri)
+    return kcsb_mgmt, QueuedIngestClient(kcsb_ingest)
 
 
 class KustoPlugin(TelemetryPlugin):
@@ -157,17 +202,14 @@ class KustoPlugin(TelemetryPlugin):
 
     def _publish_impl(self, report: TestReport) -> None:
         # Lazy imports — only needed when Kusto is actually used
-        from azure.kusto.ingest import QueuedIngestClient
-        from azure.kusto.data import KustoConnectionStringBuilder, DataFormat
+        from azure.kusto.data import DataFormat
 
         total_start = time.time()
         kusto_cfg = self._resolve_config()
         cluster = kusto_cfg["cluster"]
         database = kusto_cfg["database"]
-
-        # Auto-derive ingest_uri from cluster hostname
+        ingest_uri = kusto_cfg["ingest_uri"]
         hostname = urlparse(cluster).hostname
-        ingest_uri = f"https://ingest-{hostname}"
 
         # Auth — same credentials for both management and ingestion
         is_azure = os.getenv("AZURE_LOAD_TEST", "").lower() == "true"
@@ -175,30 +217,25 @@ class KustoPlugin(TelemetryPlugin):
         logger.info(f"Kusto plugin enabled — cluster: {hostname}, database: {database}")
         logger.info(f"Using auth: {auth_method}")
 
-        if is_azure:
-            kcsb_mgmt = KustoConnectionStringBuilder.with_aad_managed_service_identity_authentication(cluster)
-            kcsb_ingest = KustoConnectionStringBuilder.with_aad_managed_service_identity_authentication(ingest_uri)
-        else:
-            kcsb_mgmt = KustoConnectionStringBuilder.with_az_cli_authentication(cluster)
-            kcsb_ingest = KustoConnectionStringBuilder.with_az_cli_authentication(ingest_uri)
+        kcsb_mgmt, ingest_client = _get_kusto_clients(cluster, ingest_uri, is_azure)
 
         # --- Ensure database & tables exist (idempotent) ---
         self._ensure_database_and_tables(kcsb_mgmt, database)
 
         # --- Ingest data ---
-        ingest_client = QueuedIngestClient(kcsb_ingest)
+        flush_immediately = bool(kusto_cfg["flush_immediately"])
         meta = report.metadata
         ts_iso = meta.timestamp.isoformat()
         logger.info(f"Ingesting metrics for test_run_id={meta.test_run_id}")
 
         # --- Metrics ---
-        self._ingest_metrics(ingest_client, report, meta, ts_iso, database, DataFormat.CSV)
+        self._ingest_metrics(ingest_client, report, meta, ts_iso, database, DataFormat.CSV, flush_immediately)
 
         # --- Exceptions ---
-        self._ingest_exceptions(ingest_client, report, meta, ts_iso, database, DataFormat.CSV)
+        self._ingest_exceptions(ingest_client, report, meta, ts_iso, database, DataFormat.CSV, flush_immediately)
 
         # --- Summary ---
-        self._ingest_summary(ingest_client, report, meta, ts_iso, database, DataFormat.CSV)
+        self._ingest_summary(ingest_client, report, meta, ts_iso, database, DataFormat.CSV, flush_immediately)
 
         logger.info(f"Total ingestion completed in {time.time() - total_start:.1f}s")
 
@@ -307,42 +344,45 @@ class KustoPlugin(TelemetryPlugin):
     # Ingest helpers
     # ------------------------------------------------------------------
 
-    def _ingest_metrics(self, ingest_client, report, meta, ts_iso, database, data_format):
-        from azure.kusto.ingest import IngestionProperties
+    def _ingest_rows(self, ingest_client, rows, schema, table, database, data_format, flush_immediately):
+        """Ingest all rows for one table as a single gzip-compressed CSV file."""
+        from azure.kusto.ingest import IngestionProperties, FileDescriptor
+        path = _create_gzip_csv_file(rows, _columns_from_schema(schema))
+        try:
+            ingest_client.ingest_from_file(
+                FileDescriptor(path),
+                IngestionProperties(
+                    database=database, table=table, data_format=data_format,
+                    flush_immediately=flush_immediately,
+                ),
+            )
+        finally:
+            os.remove(path)
+
+    def _ingest_metrics(self, ingest_client, report, meta, ts_iso, database, data_format, flush_immediately):
         rows = [self._build_metrics_row(meta, ts_iso, ep) for ep in report.endpoint_stats]
         if rows:
             t0 = time.time()
-            columns = _columns_from_schema(METRICS_SCHEMA)
-            csv_data = _create_csv_string(rows, columns)
-            ingest_client.ingest_from_stream(
-                io.StringIO(csv_data),
-                IngestionProperties(database=database, table=TABLE_METRICS, data_format=data_format),
+            self._ingest_rows(
+                ingest_client, rows, METRICS_SCHEMA, TABLE_METRICS, database, data_format, flush_immediately
             )
             logger.info(f"{TABLE_METRICS}: {len(rows)} endpoint rows ingested ({time.time() - t0:.1f}s)")
 
-    def _ingest_exceptions(self, ingest_client, report, meta, ts_iso, database, data_format):
-        from azure.kusto.ingest import IngestionProperties
+    def _ingest_exceptions(self, ingest_client, report, meta, ts_iso, database, data_format, flush_immediately):
         rows = [self._build_exception_row(meta, ts_iso, ex) for ex in report.exceptions]
         if rows:
             t0 = time.time()
-            columns = _columns_from_schema(EXCEPTIONS_SCHEMA)
-            csv_data = _create_csv_string(rows, columns)
-            ingest_client.ingest_from_stream(
-                io.StringIO(csv_data),
-                IngestionProperties(database=database, table=TABLE_EXCEPTIONS, data_format=data_format),
+            self._ingest_rows(
+                ingest_client, rows, EXCEPTIONS_SCHEMA, TABLE_EXCEPTIONS, database, data_format, flush_immediately
             )
             logger.info(f"{TABLE_EXCEPTIONS}: {len(rows)} error rows ingested ({time.time() - t0:.1f}s)")
 
-    def _ingest_summary(self, ingest_client, report, meta, ts_iso, database, data_format):
-        from azure.kusto.ingest import IngestionProperties
+    def _ingest_summary(self, ingest_client, report, meta, ts_iso, database, data_format, flush_immediately):
         if report.summary:
             t0 = time.time()
             rows = [self._build_summary_row(meta, ts_iso, report.summary)]
-            columns = _columns_from_schema(SUMMARY_SCHEMA)
-            csv_data = _create_csv_string(rows, columns)
-            ingest_client.ingest_from_stream(
-                io.StringIO(csv_data),
-                IngestionProperties(database=database, table=TABLE_SUMMARY, data_format=data_format),
+            self._ingest_rows(
+                ingest_client, rows, SUMMARY_SCHEMA, TABLE_SUMMARY, database, data_format, flush_immediately
             )
             logger.info(f"{TABLE_SUMMARY}: 1 summary row ingested ({time.time() - t0:.1f}s)")
 
@@ -398,6 +438,8 @@ class KustoPlugin(TelemetryPlugin):
 
         Only 'cluster' is required. 'database' defaults to 'adme-performance-db'.
         'ingest_uri' is auto-derived from cluster hostname.
+        'flush_immediately' defaults to True so a finished run is queryable
+        without waiting for Kusto's ingestion batching window.
         """
         cfg = dict(self._kusto_cfg)
 
@@ -405,6 +447,9 @@ class KustoPlugin(TelemetryPlugin):
         if not cfg.get("database"):
             cfg["database"] = "adme-performance-db"
 
+        if cfg.get("flush_immediately") is None:
+            cfg["flush_immediately"] = True
+
         # Auto-derive ingest_uri from cluster (no longer needed in config)
         cluster = cfg.get("cluster", "")
         hostname = urlparse(cluster).hostname or ""
@@ -2,10 +2,47 @@
 Environment detection and configuration utilities.
 """
 
+import functools
 import os
 from typing import Dict, Any
 
 
+_ENVIRONMENT_CONFIGS = {
+    'dev': {
+        'use_managed_identity': False,
+        'log_level': 'DEBUG',
+        'timeout': 30,
+    },
+    'staging': {
+        'use_managed_identity': True,
+        'log_level': 'INFO',
+        'timeout': 60,
+    },
+    'prod': {
+        'use_managed_identity': True,
+        'log_level': 'WARNING',
+        'timeout': 120,
+    }
+}
+
+
+# Lowercased ENVIRONMENT aliases; anything else falls back to dev
+_ENVIRONMENT_ALIASES = {
+    'dev': 'dev',
+    'development': 'dev',
+    'staging': 'staging',
+    'stage': 'staging',
+    'prod': 'prod',
+    'production': 'prod',
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _normalize_environment(value: str) -> str:
+    """Map a raw ENVIRONMENT value to dev, staging or prod (cached per value)."""
+    return _ENVIRONMENT_ALIASES.get(value.casefold(), 'dev')
+
+
 def detect_environment() -> str:
     """
     Detect the current environment (dev, staging, prod).
@@ -13,15 +50,7 @@ def detect_environment() -> str:
     Returns:
         str: Environment name
     """
-    env = os.getenv('ENVIRONMENT', 'dev').lower()
-    if env in ['dev', 'development']:
-        return 'dev'
-    elif env in ['staging', 'stage']:
-        return 'staging'
-    elif env in ['prod', 'production']:
-        return 'prod'
-    else:
-        return 'dev'
+    return _normalize_environment(os.getenv('ENVIRONMENT', 'dev'))
 
 
 def get_environment_config() -> Dict[str, Any]:
@@ -29,26 +58,7 @@ def get_environment_config() -> Dict[str, Any]:
     Get environment-specific configuration.
     
     Returns:
-        Dict: Configuration settings
+        Dict: Configuration settings (a fresh copy the caller may modify)
     """
     env = detect_environment()
-    
-    config = {
-        'dev': {
-            'use_managed_identity': False,
-            'log_level': 'DEBUG',
-            'timeout': 30,
-        },
-        'staging': {
-            'use_managed_identity': True,
-            'log_level': 'INFO',
-            'timeout': 60,
-        },
-        'prod': {
-            'use_managed_identity': True,
-            'log_level': 'WARNING',
-            'timeout': 120,
-        }
-    }
-    
-    return config.get(env, config['dev'])
+    return dict(_ENVIRONMENT_CONFIGS.get(env, _ENVIRONMENT_CONFIGS['dev']))
@@ -1,7 +1,6 @@
 """Shared test fixtures for osdu_perf tests."""
 import pytest
 from unittest.mock import Mock, MagicMock
-from azure.core.credentials import AccessToken
 import time
 
 
@@ -16,6 +15,22 @@ def mock_http_client():
     return client
 
 
+@pytest.fixture
+def mock_client():
+    """Mock HTTP client handed to services (shared by the service and orchestrator tests)."""
+    client = Mock()
+    client.get = Mock(return_value=Mock(status_code=200))
+    client.post = Mock(return_value=Mock(status_code=201))
+    return client
+
+
+@pytest.fixture(scope="session")
+def cli_parser():
+    """Build the CLI parser once per session; parse_args() never mutates it."""
+    from osdu_perf.cli.command_registry import CommandRegistry
+    return CommandRegistry(Mock()).build_parser()
+
+
 @pytest.fixture
 def mock_locust_environment():
     """Mock Locust environment for testing."""
@@ -30,6 +45,7 @@ def mock_locust_environment():
 @pytest.fixture
 def mock_access_token():
     """Mock Azure access token."""
+    from azure.core.credentials import AccessToken
     return AccessToken(token="test-token", expires_on=time.time() + 3600)
 
 
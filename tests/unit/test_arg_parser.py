@@ -16,13 +16,13 @@ from osdu_perf.cli.command_registry import CommandRegistry
 class TestCommandRegistryParser:
     """Test cases for the parser built by CommandRegistry."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, cli_parser):
         """Set up test fixtures."""
-        self.logger = Mock()
-        self.registry = CommandRegistry(self.logger)
+        self.parser = cli_parser
 
     def _build(self) -> ArgumentParser:
-        return self.registry.build_parser()
+        return self.parser
 
     def test_build_parser_returns_argument_parser(self):
         """Test that build_parser returns an ArgumentParser."""
@@ -305,21 +305,22 @@ class TestCommandRegistryParser:
     def test_resolve_returns_correct_command(self):
         """Test that resolve returns the correct command instance."""
         parser = self._build()
+        registry = CommandRegistry(Mock())
         
         args = parser.parse_args(['init', 'storage'])
-        cmd = self.registry.resolve(args)
+        cmd = registry.resolve(args)
         assert type(cmd).__name__ == 'InitCommand'
         
         args = parser.parse_args(['version'])
-        cmd = self.registry.resolve(args)
+        cmd = registry.resolve(args)
         assert type(cmd).__name__ == 'VersionCommand'
         
         args = parser.parse_args(['run', 'local', '--scenario', 's', '--token', 't'])
-        cmd = self.registry.resolve(args)
+        cmd = registry.resolve(args)
         assert type(cmd).__name__ == 'LocalTestCommand'
         
         args = parser.parse_args(['run', 'azure_load_test', '--scenario', 's', '--token', 't'])
-        cmd = self.registry.resolve(args)
+        cmd = registry.resolve(args)
         assert type(cmd).__name__ == 'AzureLoadTestCommand'
 
 
@@ -0,0 +1,26 @@
+"""Unit tests for AzureLoadTestConfig."""
+
+import pytest
+
+from osdu_perf.operations.azure_test_operation.config import AzureLoadTestConfig
+
+
+def _config():
+    return AzureLoadTestConfig(
+        subscription_id="sub-1", resource_group_name="rg-1", load_test_name="lt-1"
+    )
+
+
+class TestCompressUploads:
+    """compress_uploads is opt-in through OSDU_COMPRESS_UPLOADS."""
+
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("OSDU_COMPRESS_UPLOADS", raising=False)
+        assert _config().compress_uploads is False
+
+    @pytest.mark.parametrize("value, expected", [("true", True), ("TRUE", True), ("false", False), ("1", False)])
+    def test_follows_environment(self, monkeypatch, value, expected):
+        monkeypatch.setenv("OSDU_COMPRESS_UPLOADS", value)
+        config = _config()
+        assert config.compress_uploads is expected
+        assert config.to_dict()["compress_uploads"] is expected
@@ -0,0 +1,69 @@
+"""Unit tests for AzureLoadTestRunner."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from osdu_perf.operations.auth import TokenCachingCredential
+from osdu_perf.operations.azure_test_operation.azure_test_runner import AzureLoadTestRunner
+
+
+class TestCredentialCache:
+    """Runners in one process share one token-caching credential per subscription."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        AzureLoadTestRunner.clear_credential_cache()
+        yield
+        AzureLoadTestRunner.clear_credential_cache()
+
+    @pytest.fixture
+    def cli_credential(self):
+        with patch("azure.identity.AzureCliCredential") as credential_class:
+            yield credential_class
+
+    def test_credential_is_reused_per_subscription(self, cli_credential):
+        first = AzureLoadTestRunner._get_cached_credential("sub-1")
+        second = AzureLoadTestRunner._get_cached_credential("sub-1")
+
+        assert isinstance(first, TokenCachingCredential)
+        assert first is second
+        cli_credential.assert_called_once_with()
+
+    def test_subscriptions_get_separate_credentials(self, cli_credential):
+        first = AzureLoadTestRunner._get_cached_credential("sub-1")
+        second = AzureLoadTestRunner._get_cached_credential("sub-2")
+
+        assert first is not second
+        assert cli_credential.call_count == 2
+
+    def test_clear_credential_cache_creates_a_new_credential(self, cli_credential):
+        first = AzureLoadTestRunner._get_cached_credential("sub-1")
+
+        AzureLoadTestRunner.clear_credential_cache()
+
+        assert AzureLoadTestRunner._get_cached_credential("sub-1") is not first
+        assert cli_credential.call_count == 2
+
+
+class TestClose:
+    """The runner owns the pooled session its SDK clients share."""
+
+    @pytest.fixture
+    def runner(self):
+        runner = AzureLoadTestRunner.__new__(AzureLoadTestRunner)
+        runner._http_session = Mock()
+        return runner
+
+    def test_close_closes_pooled_session(self, runner):
+        runner.close()
+
+        runner._http_session.close.assert_called_once_with()
+
+    def test_context_manager_closes_on_exit(self, runner):
+        with pytest.raises(RuntimeError):
+            with runner as entered:
+                assert entered is runner
+                raise RuntimeError("upload failed")
+
+        runner._http_session.close.assert_called_once_with()
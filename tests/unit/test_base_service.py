@@ -12,6 +12,8 @@ class TestBaseService:
     class ConcreteService(BaseService):
         """Concrete implementation for testing."""
         
+        __slots__ = ()
+        
         def execute(self, headers=None, partition=None, host=None):
             """Test implementation of execute method."""
             return f"Executed with headers={headers}, partition={partition}, host={host}"
@@ -30,15 +32,7 @@ class TestBaseService:
     
     class IncompleteService(BaseService):
         """Incomplete implementation for testing abstract method enforcement."""
-        pass
-    
-    @pytest.fixture
-    def mock_client(self):
-        """Mock HTTP client."""
-        client = Mock()
-        client.get = Mock(return_value=Mock(status_code=200))
-        client.post = Mock(return_value=Mock(status_code=201))
-        return client
+        __slots__ = ()
     
     def test_concrete_service_initialization(self, mock_client):
         """Test concrete service initialization."""
@@ -95,6 +89,22 @@ class TestBaseService:
         expected_methods = {'execute', 'provide_explicit_token', 'prehook', 'posthook'}
         assert abstract_methods == expected_methods
     
+    def test_base_service_has_slots(self, mock_client):
+        """Test slotted subclasses carry no per-instance __dict__."""
+        service = self.ConcreteService(client=mock_client)
+        assert BaseService.__slots__ == ('client',)
+        assert not hasattr(service, '__dict__')
+        assert service.client is mock_client
+    
+    def test_unslotted_subclass_keeps_dict(self):
+        """Test services that don't declare __slots__ can still set attributes."""
+        class PlainService(self.ConcreteService):
+            pass
+        
+        service = PlainService()
+        service.name = "plain"
+        assert service.name == "plain"
+    
     def test_service_with_client_operations(self, mock_client):
         """Test service operations with client."""
         service = self.ConcreteService(client=mock_client)
@@ -114,6 +124,8 @@ class TestBaseServiceInheritance:
     class MinimalService(BaseService):
         """Minimal implementation with required methods."""
         
+        __slots__ = ('name',)
+        
         def __init__(self, client=None, name="minimal"):
             super().__init__(client)
             self.name = name
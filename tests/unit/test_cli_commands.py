@@ -2,12 +2,14 @@
 Test cases for CLI command classes.
 """
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from osdu_perf.cli.commands.version_command import VersionCommand
 from osdu_perf.cli.commands.init_command import InitCommand
 from osdu_perf.cli.commands.run_local_command import LocalTestCommand
 from osdu_perf.cli.commands.run_azure_command import AzureLoadTestCommand
 from osdu_perf.cli.command_registry import CommandRegistry
+from osdu_perf.cli.command_base import Command
 
 
 class TestVersionCommand:
@@ -20,26 +22,27 @@ class TestVersionCommand:
     
     def test_validate_args_always_returns_true(self):
         """Test that validate_args always returns True for version command."""
-        args = Mock()
+        args = SimpleNamespace()
         result = self.version_command.validate_args(args)
         assert result is True
     
     def test_execute_success(self):
         """Test successful execution of version command."""
-        args = Mock()
+        args = SimpleNamespace()
         with patch.object(self.version_command, 'version_command') as mock_version:
             result = self.version_command.execute(args)
             mock_version.assert_called_once()
             assert result == 0
     
-    def test_execute_handles_exception(self):
+    def test_execute_handles_exception(self, monkeypatch):
         """Test that execute handles exceptions properly."""
-        args = Mock()
-        with patch.object(self.version_command, 'version_command', side_effect=Exception("test error")):
-            with patch.object(self.version_command, 'handle_error', return_value=1) as mock_handle:
-                result = self.version_command.execute(args)
-                mock_handle.assert_called_once()
-                assert result == 1
+        args = SimpleNamespace()
+        mock_handle = Mock(return_value=1)
+        monkeypatch.setattr(self.version_command, 'version_command', Mock(side_effect=Exception("test error")))
+        monkeypatch.setattr(self.version_command, 'handle_error', mock_handle)
+        result = self.version_command.execute(args)
+        mock_handle.assert_called_once()
+        assert result == 1
     
     def test_version_command_basic_info(self):
         """Test version_command displays basic information."""
@@ -86,16 +89,14 @@ class TestInitCommand:
     
     def test_validate_args_success(self):
         """Test successful args validation."""
-        args = Mock()
-        args.service_name = "test_service"
+        args = SimpleNamespace(service_name="test_service")
         
         result = self.init_command.validate_args(args)
         assert result is True
     
     def test_validate_args_missing_service_name(self):
         """Test validation failure when service_name is missing."""
-        args = Mock()
-        args.service_name = None
+        args = SimpleNamespace(service_name=None)
         
         result = self.init_command.validate_args(args)
         assert result is False
@@ -103,8 +104,7 @@ class TestInitCommand:
     
     def test_validate_args_empty_service_name(self):
         """Test validation failure when service_name is empty."""
-        args = Mock()
-        args.service_name = ""
+        args = SimpleNamespace(service_name="")
         
         result = self.init_command.validate_args(args)
         assert result is False
@@ -112,7 +112,7 @@ class TestInitCommand:
     
     def test_validate_args_no_service_name_attribute(self):
         """Test validation failure when args has no service_name attribute."""
-        args = Mock(spec=[])  # Mock with no attributes
+        args = SimpleNamespace()  # no attributes
         
         result = self.init_command.validate_args(args)
         assert result is False
@@ -120,8 +120,7 @@ class TestInitCommand:
     
     def test_execute_validation_failure(self):
         """Test execute when validation fails."""
-        args = Mock()
-        args.service_name = None
+        args = SimpleNamespace(service_name=None)
         
         result = self.init_command.execute(args)
         assert result == 1
@@ -142,55 +141,36 @@ class TestCommandRegistry:
 
     def test_registered_commands_include_all(self):
         """Test that all expected commands are auto-registered."""
-        from osdu_perf.cli.command_base import Command
         names = [cls.name for cls in Command._registry]
         assert 'init' in names
         assert 'version' in names
         assert 'local' in names
         assert 'azure_load_test' in names
 
-    def test_resolve_init_command(self):
-        """Test resolving the init command."""
-        parser = self.registry.build_parser()
-        args = parser.parse_args(['init', 'storage'])
-        cmd = self.registry.resolve(args)
-        assert isinstance(cmd, InitCommand)
-
-    def test_resolve_version_command(self):
-        """Test resolving the version command."""
-        parser = self.registry.build_parser()
-        args = parser.parse_args(['version'])
-        cmd = self.registry.resolve(args)
-        assert isinstance(cmd, VersionCommand)
-
-    def test_resolve_local_command(self):
-        """Test resolving the local command."""
-        parser = self.registry.build_parser()
-        args = parser.parse_args(['run', 'local', '--scenario', 's', '--token', 't'])
-        cmd = self.registry.resolve(args)
-        assert isinstance(cmd, LocalTestCommand)
-
-    def test_resolve_azure_command(self):
-        """Test resolving the azure_load_test command."""
-        parser = self.registry.build_parser()
-        args = parser.parse_args(['run', 'azure_load_test', '--scenario', 's', '--token', 't'])
+    @pytest.mark.parametrize("argv, command_class", [
+        (['init', 'storage'], InitCommand),
+        (['version'], VersionCommand),
+        (['run', 'local', '--scenario', 's', '--token', 't'], LocalTestCommand),
+        (['run', 'azure_load_test', '--scenario', 's', '--token', 't'], AzureLoadTestCommand),
+    ])
+    def test_resolve_command(self, cli_parser, argv, command_class):
+        """Test parsed argv resolves to the matching command class."""
+        args = cli_parser.parse_args(argv)
         cmd = self.registry.resolve(args)
-        assert isinstance(cmd, AzureLoadTestCommand)
+        assert isinstance(cmd, command_class)
 
-    def test_resolve_and_execute_version(self):
+    def test_resolve_and_execute_version(self, cli_parser):
         """Test resolving and executing the version command."""
-        parser = self.registry.build_parser()
-        args = parser.parse_args(['version'])
+        args = cli_parser.parse_args(['version'])
         cmd = self.registry.resolve(args)
         with patch.object(cmd, 'version_command'):
             result = cmd.execute(args)
             assert result == 0
 
-    def test_invalid_command_raises_system_exit(self):
+    def test_invalid_command_raises_system_exit(self, cli_parser):
         """Test that invalid commands raise SystemExit."""
-        parser = self.registry.build_parser()
         with pytest.raises(SystemExit):
-            parser.parse_args(['unknown_command'])
+            cli_parser.parse_args(['unknown_command'])
             
             # Check that invocation was logged
             calls = [call.args[0] for call in self.logger_mock.info.call_args_list]
@@ -198,4 +178,71 @@ class TestCommandRegistry:
             execution_calls = [call for call in calls if "Executing command: version" in call]
             
             assert len(invocation_calls) >= 1
-            assert len(execution_calls) >= 1
\ No newline at end of file
+            assert len(execution_calls) >= 1
+
+
+def _recording_step(steps, step, result=None):
+    """Mock that appends its step name to steps and returns result."""
+    def record(*args):
+        steps.append(step)
+        return result
+    return Mock(side_effect=record)
+
+
+class TestAzureLoadTestCommandExecute:
+    """Test cases for the AzureLoadTestCommand.execute workflow."""
+    
+    @pytest.fixture
+    def steps(self):
+        """Order in which the stubbed workflow steps ran."""
+        return []
+    
+    @pytest.fixture
+    def command(self, monkeypatch, steps):
+        """AzureLoadTestCommand with configuration and every Azure step stubbed."""
+        command = AzureLoadTestCommand(Mock())
+        runner = Mock(load_test_name="lt")
+        runner.create_load_test_resource.return_value = True
+        monkeypatch.setattr(command, '_load_azure_configuration', Mock(return_value={}))
+        monkeypatch.setattr(command, '_validate_azure_parameters', Mock())
+        monkeypatch.setattr(command, '_log_configuration_details', Mock())
+        monkeypatch.setattr(command, '_create_azure_test_runner', Mock(return_value=runner))
+        monkeypatch.setattr(command, '_create_tests_and_upload', _recording_step(steps, 'upload', True))
+        monkeypatch.setattr(command, '_setup_azure_entitlements', _recording_step(steps, 'entitlements'))
+        monkeypatch.setattr(command, '_wait_for_test_initialization', _recording_step(steps, 'wait'))
+        monkeypatch.setattr(command, '_execute_load_test', _recording_step(steps, 'run'))
+        return command
+    
+    def test_entitlements_follow_successful_upload(self, command, steps):
+        """Test entitlements start after the upload and finish before the run starts."""
+        result = command.execute(SimpleNamespace(scenario="s"))
+        
+        assert result == 0
+        assert steps[0] == 'upload'
+        assert set(steps[1:3]) == {'entitlements', 'wait'}
+        assert steps[3:] == ['run']
+    
+    def test_failed_upload_skips_entitlements(self, command, steps):
+        """Test a failed upload makes no entitlement changes and does not start the run."""
+        command._create_tests_and_upload = _recording_step(steps, 'upload', False)
+        
+        result = command.execute(SimpleNamespace(scenario="s"))
+        
+        assert result == 1
+        assert steps == ['upload']
+    
+    def test_runner_is_closed_after_run(self, command):
+        """Test the runner's pooled session is released once the workflow finishes."""
+        command.execute(SimpleNamespace(scenario="s"))
+        
+        command._create_azure_test_runner.return_value.close.assert_called_once_with()
+    
+    def test_runner_is_closed_after_failure(self, command):
+        """Test the runner is closed when a step raises."""
+        command._execute_load_test = Mock(side_effect=RuntimeError("run failed"))
+        command.handle_error = Mock(return_value=1)
+        
+        result = command.execute(SimpleNamespace(scenario="s"))
+        
+        assert result == 1
+        command._create_azure_test_runner.return_value.close.assert_called_once_with()
@@ -0,0 +1,143 @@
+"""Unit tests for the telemetry dispatcher."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from osdu_perf.telemetry.dispatcher import TelemetryDispatcher
+
+
+_METADATA_VARS = ("PARTITION", "PERFORMANCE_TIER", "SKU", "VERSION", "LOCUST_TAGS")
+
+
+class TestResolveRunMetadata:
+    """_resolve_run_metadata keeps the InputHandler and env var precedence."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, monkeypatch):
+        for name in _METADATA_VARS:
+            monkeypatch.delenv(name, raising=False)
+
+    @pytest.fixture
+    def input_handler(self):
+        handler = Mock()
+        handler.partition = "opendes"
+        handler.get_osdu_performance_tier.return_value = "standard"
+        handler.get_osdu_version.return_value = "M25"
+        handler.get_test_scenario.return_value = "search"
+        return handler
+
+    def test_input_handler_receives_env_overrides(self, input_handler, monkeypatch):
+        monkeypatch.setenv("SKU", "flex")
+        monkeypatch.setenv("VERSION", "M26")
+        monkeypatch.setenv("LOCUST_TAGS", "storage")
+
+        result = TelemetryDispatcher._resolve_run_metadata(input_handler)
+
+        assert result == ("opendes", "standard", "M25", "search")
+        input_handler.get_osdu_performance_tier.assert_called_once_with("flex")
+        input_handler.get_osdu_version.assert_called_once_with("M26")
+        input_handler.get_test_scenario.assert_called_once_with("storage")
+
+    def test_empty_performance_tier_does_not_fall_back_to_sku(self, input_handler, monkeypatch):
+        monkeypatch.setenv("PERFORMANCE_TIER", "")
+        monkeypatch.setenv("SKU", "flex")
+
+        TelemetryDispatcher._resolve_run_metadata(input_handler)
+
+        input_handler.get_osdu_performance_tier.assert_called_once_with("")
+
+    def test_input_handler_values_are_passed_through(self, input_handler):
+        input_handler.partition = ""
+        input_handler.get_osdu_version.return_value = None
+
+        partition, _, version, _ = TelemetryDispatcher._resolve_run_metadata(input_handler)
+
+        assert partition == ""
+        assert version is None
+
+    def test_without_input_handler_unset_vars_are_unknown(self):
+        assert TelemetryDispatcher._resolve_run_metadata(None) == ("Unknown",) * 4
+
+    def test_without_input_handler_env_values_are_used(self, monkeypatch):
+        monkeypatch.setenv("PARTITION", "opendes")
+        monkeypatch.setenv("SKU", "flex")
+        monkeypatch.setenv("VERSION", "")
+        monkeypatch.setenv("LOCUST_TAGS", "search")
+
+        result = TelemetryDispatcher._resolve_run_metadata(None)
+
+        assert result == ("opendes", "flex", "", "search")
+
+
+class TestDispatchSkipsEmptyRuns:
+    """dispatch() only builds and publishes a report when requests were recorded."""
+
+    @pytest.fixture
+    def plugin(self):
+        plugin = Mock()
+        plugin.is_enabled.return_value = True
+        plugin.name.return_value = "mock"
+        return plugin
+
+    @pytest.fixture
+    def dispatcher(self, plugin, monkeypatch):
+        dispatcher = TelemetryDispatcher([plugin], {})
+        monkeypatch.setattr(dispatcher, "_build_report", Mock(return_value=Mock(endpoint_stats=[], exceptions=[], summary=None)))
+        return dispatcher
+
+    @staticmethod
+    def _environment(entries, num_requests):
+        environment = Mock()
+        environment.runner.stats.entries = entries
+        environment.runner.stats.total.num_requests = num_requests
+        return environment
+
+    def test_recorded_requests_are_published(self, dispatcher, plugin):
+        dispatcher.dispatch(self._environment({("/api/search", "GET"): Mock()}, 3), None)
+
+        dispatcher._build_report.assert_called_once()
+        plugin.publish.assert_called_once_with(dispatcher._build_report.return_value)
+
+    @pytest.mark.parametrize("entries, num_requests", [({}, 0), ({("/api/search", "GET"): Mock()}, 0)])
+    def test_empty_run_is_skipped(self, dispatcher, plugin, entries, num_requests):
+        dispatcher.dispatch(self._environment(entries, num_requests), None)
+
+        dispatcher._build_report.assert_not_called()
+        plugin.publish.assert_not_called()
+
+    def test_malformed_environment_still_reaches_report_building(self, dispatcher, plugin):
+        dispatcher.dispatch(Mock(spec=[]), None)
+
+        dispatcher._build_report.assert_called_once()
+
+
+class TestReportNames:
+    """The memoized host and path parsers give each report row its own names."""
+
+    @staticmethod
+    def _stats_entry(name, method):
+        entry = MagicMock()
+        entry.name, entry.method = name, method
+        entry.num_requests, entry.total_content_length = 1, 0
+        entry.start_time = entry.last_request_timestamp = None
+        return entry
+
+    def test_report_services_follow_each_entry(self):
+        environment = MagicMock()
+        environment.host = "https://adme.energy.azure.com"
+        environment.runner.start_time = None
+        environment.runner.stats.entries = {
+            ("/api/search/v2/query", "POST"): self._stats_entry("/api/search/v2/query", "POST"),
+            ("/api/storage/v2/records", "GET"): self._stats_entry("/api/storage/v2/records", "GET"),
+            ("/api/search/v2/query", "GET"): self._stats_entry("/api/search/v2/query", "GET"),
+        }
+        error = Mock(method="POST", error="boom", occurrences=2)
+        error.name = "/api/storage/v2/records"
+        environment.runner.stats.errors = {"storage": error}
+
+        report = TelemetryDispatcher([], {})._build_report(environment, None)
+
+        assert report.metadata.adme_name == "adme.energy.azure.com"
+        assert [ep.service for ep in report.endpoint_stats] == ["search", "storage", "search"]
+        assert [ex.service for ex in report.exceptions] == ["storage"]
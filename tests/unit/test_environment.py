@@ -1,61 +1,60 @@
 """Unit tests for utils environment module."""
 import pytest
-import os
 from unittest.mock import patch
 
 from osdu_perf.utils.environment import detect_environment, get_environment_config
 
+# ENVIRONMENT values grouped by the environment detect_environment should report
+DEV_VALUES = ('dev', 'development', 'DEV', 'DEVELOPMENT', 'Dev', 'Development')
+STAGING_VALUES = ('staging', 'stage', 'STAGING', 'STAGE', 'Staging', 'Stage')
+PROD_VALUES = ('prod', 'production', 'PROD', 'PRODUCTION', 'Prod', 'Production')
+UNKNOWN_VALUES = ('test', 'unknown', 'local', 'custom')
+
 
 class TestEnvironmentUtils:
     """Test cases for environment utilities."""
     
-    def test_detect_environment_default(self):
+    def test_detect_environment_default(self, monkeypatch):
         """Test detect_environment returns dev by default."""
-        with patch.dict(os.environ, {}, clear=True):
-            env = detect_environment()
-            assert env == 'dev'
-    
-    def test_detect_environment_dev_values(self):
-        """Test detect_environment with various dev values."""
-        dev_values = ['dev', 'development', 'DEV', 'DEVELOPMENT', 'Dev', 'Development']
-        
-        for value in dev_values:
-            with patch.dict(os.environ, {'ENVIRONMENT': value}, clear=True):
-                env = detect_environment()
-                assert env == 'dev', f"Failed for value: {value}"
+        monkeypatch.delenv('ENVIRONMENT', raising=False)
+        env = detect_environment()
+        assert env == 'dev'
     
-    def test_detect_environment_staging_values(self):
-        """Test detect_environment with various staging values."""
-        staging_values = ['staging', 'stage', 'STAGING', 'STAGE', 'Staging', 'Stage']
-        
-        for value in staging_values:
-            with patch.dict(os.environ, {'ENVIRONMENT': value}, clear=True):
-                env = detect_environment()
-                assert env == 'staging', f"Failed for value: {value}"
+    @pytest.mark.parametrize("value, expected", [
+        *((value, 'dev') for value in DEV_VALUES),
+        *((value, 'staging') for value in STAGING_VALUES),
+        *((value, 'prod') for value in PROD_VALUES),
+        # Unknown values fall back to dev
+        *((value, 'dev') for value in UNKNOWN_VALUES),
+    ])
+    def test_detect_environment_values(self, monkeypatch, value, expected):
+        """Test detect_environment maps ENVIRONMENT aliases case-insensitively."""
+        monkeypatch.setenv('ENVIRONMENT', value)
+        assert detect_environment() == expected
     
-    def test_detect_environment_prod_values(self):
-        """Test detect_environment with various production values."""
-        prod_values = ['prod', 'production', 'PROD', 'PRODUCTION', 'Prod', 'Production']
-        
-        for value in prod_values:
-            with patch.dict(os.environ, {'ENVIRONMENT': value}, clear=True):
-                env = detect_environment()
-                assert env == 'prod', f"Failed for value: {value}"
+    def test_detect_environment_empty_string(self, monkeypatch):
+        """Test detect_environment with empty environment variable."""
+        monkeypatch.setenv('ENVIRONMENT', '')
+        env = detect_environment()
+        assert env == 'dev'
     
-    def test_detect_environment_unknown_value(self):
-        """Test detect_environment with unknown environment value."""
-        unknown_values = ['test', 'unknown', 'local', 'custom']
-        
-        for value in unknown_values:
-            with patch.dict(os.environ, {'ENVIRONMENT': value}, clear=True):
-                env = detect_environment()
-                assert env == 'dev', f"Failed for value: {value}, should default to dev"
+    def test_detect_environment_follows_variable_changes(self, monkeypatch):
+        """Test the per-value cache doesn't pin the first detected environment."""
+        monkeypatch.setenv('ENVIRONMENT', 'production')
+        assert detect_environment() == 'prod'
+        assert get_environment_config()['timeout'] == 120
+        monkeypatch.setenv('ENVIRONMENT', 'stage')
+        assert detect_environment() == 'staging'
+        assert get_environment_config()['timeout'] == 60
+        monkeypatch.setenv('ENVIRONMENT', 'production')
+        assert get_environment_config()['log_level'] == 'WARNING'
     
-    def test_detect_environment_empty_string(self):
-        """Test detect_environment with empty environment variable."""
-        with patch.dict(os.environ, {'ENVIRONMENT': ''}, clear=True):
-            env = detect_environment()
-            assert env == 'dev'
+    def test_get_environment_config_returns_copy(self):
+        """Test callers can modify the returned config without affecting later calls."""
+        with patch('osdu_perf.utils.environment.detect_environment', return_value='dev'):
+            config = get_environment_config()
+            config['timeout'] = 999
+            assert get_environment_config()['timeout'] == 30
     
     def test_get_environment_config_dev(self):
         """Test get_environment_config for dev environment."""
@@ -146,7 +145,7 @@ class TestEnvironmentUtils:
         
         assert dev_config['timeout'] < staging_config['timeout'] < prod_config['timeout']
     
-    def test_integration_detect_and_config(self):
+    def test_integration_detect_and_config(self, monkeypatch):
         """Test integration between detect_environment and get_environment_config."""
         test_cases = [
             ('dev', {'use_managed_identity': False, 'log_level': 'DEBUG', 'timeout': 30}),
@@ -155,9 +154,9 @@ class TestEnvironmentUtils:
         ]
         
         for env_value, expected_config in test_cases:
-            with patch.dict(os.environ, {'ENVIRONMENT': env_value}, clear=True):
-                detected_env = detect_environment()
-                config = get_environment_config()
-                
-                assert detected_env == env_value
-                assert config == expected_config
\ No newline at end of file
+            monkeypatch.setenv('ENVIRONMENT', env_value)
+            detected_env = detect_environment()
+            config = get_environment_config()
+            
+            assert detected_env == env_value
+            assert config == expected_config
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""Unit tests for AzureLoadTestFileManager."""
+
+import gzip
+from unittest.mock import Mock
+
+import pytest
+from azure.core.exceptions import HttpResponseError
+
+from osdu_perf.operations.azure_test_operation.file_manager import (
+    AzureLoadTestFileManager, COMPRESSION_MIN_BYTES,
+)
+
+
+@pytest.fixture
+def admin_client():
+    """LoadTestAdministrationClient mock whose upload pollers finish at once."""
+    client = Mock()
+    client.begin_upload_test_file.return_value.result.return_value = {"status": "VALIDATION_SUCCESS"}
+    return client
+
+
+def _http_error(status_code):
+    error = HttpResponseError(message=f"HTTP {status_code}")
+    error.status_code = status_code
+    return error
+
+
+class TestCompressedUploads:
+    """Large text files are gzipped when compress_uploads is on."""
+
+    @pytest.fixture
+    def large_script(self, tmp_path):
+        path = tmp_path / "perf_search_test.py"
+        path.write_bytes(b"print('search')\n" * (COMPRESSION_MIN_BYTES // 8))
+        return path
+
+    def test_large_text_file_is_sent_gzipped(self, admin_client, large_script):
+        manager = AzureLoadTestFileManager(admin_client, compress_uploads=True)
+
+        manager._upload_file("test-1", large_script, "ADDITIONAL_ARTIFACTS")
+
+        kwargs = admin_client.begin_upload_test_file.call_args.kwargs
+        assert kwargs["headers"] == {"Content-Encoding": "gzip"}
+        assert gzip.decompress(kwargs["body"]) == large_script.read_bytes()
+
+    def test_compression_is_off_by_default(self, admin_client, large_script):
+        AzureLoadTestFileManager(admin_client)._upload_file("test-1", large_script, "ADDITIONAL_ARTIFACTS")
+
+        assert "headers" not in admin_client.begin_upload_test_file.call_args.kwargs
+
+    def test_small_file_is_sent_uncompressed(self, admin_client, tmp_path):
+        small = tmp_path / "requirements.txt"
+        small.write_text("osdu_perf\n")
+
+        AzureLoadTestFileManager(admin_client, compress_uploads=True)._upload_file(
+            "test-1", small, "ADDITIONAL_ARTIFACTS"
+        )
+
+        assert "headers" not in admin_client.begin_upload_test_file.call_args.kwargs
+
+    def test_415_retries_uncompressed(self, admin_client, large_script):
+        poller = Mock()
+        poller.result.return_value = {"status": "VALIDATION_SUCCESS"}
+        admin_client.begin_upload_test_file.side_effect = [_http_error(415), poller]
+        manager = AzureLoadTestFileManager(admin_client, compress_uploads=True)
+
+        result = manager._upload_file("test-1", large_script, "ADDITIONAL_ARTIFACTS")
+
+        assert result == {"status": "VALIDATION_SUCCESS"}
+        first, second = admin_client.begin_upload_test_file.call_args_list
+        assert first.kwargs["headers"] == {"Content-Encoding": "gzip"}
+        assert "headers" not in second.kwargs
+
+    def test_other_http_errors_are_raised(self, admin_client, large_script):
+        admin_client.begin_upload_test_file.side_effect = _http_error(500)
+        manager = AzureLoadTestFileManager(admin_client, compress_uploads=True)
+
+        with pytest.raises(HttpResponseError):
+            manager._upload_file("test-1", large_script, "ADDITIONAL_ARTIFACTS")
+
+        admin_client.begin_upload_test_file.assert_called_once()
+
+
+class TestUploadFile:
+    """Plain uploads pass only the documented begin_upload_test_file arguments."""
+
+    def test_upload_call_arguments(self, admin_client, tmp_path):
+        script = tmp_path / "locustfile.py"
+        script.write_text("from locust import task\n")
+
+        result = AzureLoadTestFileManager(admin_client)._upload_file("test-1", script, "JMX_FILE")
+
+        assert result == {"status": "VALIDATION_SUCCESS"}
+        kwargs = admin_client.begin_upload_test_file.call_args.kwargs
+        assert set(kwargs) == {"test_id", "file_name", "file_type", "body"}
+        assert (kwargs["test_id"], kwargs["file_name"], kwargs["file_type"]) == ("test-1", "locustfile.py", "JMX_FILE")
+
+
+class TestUploadFilesForTest:
+    """Artifacts upload concurrently; locustfile.py always goes last."""
+
+    @pytest.fixture
+    def test_files(self, tmp_path):
+        names = ["locustfile.py", "perf_search_test.py", "perf_storage_test.py", "requirements.txt"]
+        for name in names:
+            (tmp_path / name).write_text(name)
+        return [tmp_path / name for name in names]
+
+    @staticmethod
+    def _uploaded_names(admin_client):
+        return [c.kwargs["file_name"] for c in admin_client.begin_upload_test_file.call_args_list]
+
+    def test_locustfile_is_uploaded_last(self, admin_client, test_files):
+        uploaded = AzureLoadTestFileManager(admin_client).upload_files_for_test("test-1", test_files)
+
+        assert self._uploaded_names(admin_client)[-1] == "locustfile.py"
+        assert [(f["fileName"], f["fileType"]) for f in uploaded] == [
+            ("perf_search_test.py", "ADDITIONAL_ARTIFACTS"),
+            ("perf_storage_test.py", "ADDITIONAL_ARTIFACTS"),
+            ("requirements.txt", "ADDITIONAL_ARTIFACTS"),
+            ("locustfile.py", "JMX_FILE"),
+        ]
+
+    def test_missing_files_are_skipped(self, admin_client, test_files, tmp_path):
+        uploaded = AzureLoadTestFileManager(admin_client).upload_files_for_test(
+            "test-1", test_files + [tmp_path / "perf_missing_test.py"]
+        )
+
+        assert "perf_missing_test.py" not in self._uploaded_names(admin_client)
+        assert len(uploaded) == len(test_files)
+
+    def test_failed_artifact_keeps_others_and_skips_locustfile(self, admin_client, test_files):
+        def _upload(**kwargs):
+            if kwargs["file_name"] == "perf_storage_test.py":
+                raise _http_error(500)
+            return Mock()
+
+        admin_client.begin_upload_test_file.side_effect = _upload
+
+        uploaded = AzureLoadTestFileManager(admin_client).upload_files_for_test("test-1", test_files)
+
+        assert [f["fileName"] for f in uploaded] == ["perf_search_test.py", "requirements.txt"]
+        assert "locustfile.py" not in self._uploaded_names(admin_client)
+
+
+class TestFindTestFiles:
+    """find_test_files picks *.py, perf_*.json and requirements.txt, sorted."""
+
+    def test_selected_files(self, admin_client, tmp_path):
+        for name in [
+            "locustfile.py", "perf_storage_test.py", "helpers.py", "perf_config.json",
+            "requirements.txt", ".hidden.py", "config.json", "perf_notes.txt", "README.md",
+        ]:
+            (tmp_path / name).write_text(name)
+        (tmp_path / "package.py").mkdir()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "perf_nested_test.py").write_text("nested")
+
+        found = AzureLoadTestFileManager(admin_client).find_test_files(str(tmp_path))
+
+        assert found == [
+            str(tmp_path / name)
+            for name in ["helpers.py", "locustfile.py", "perf_config.json", "perf_storage_test.py", "requirements.txt"]
+        ]
+
+    def test_packaged_locustfile_is_added_when_missing(self, admin_client, tmp_path, monkeypatch):
+        (tmp_path / "perf_search_test.py").write_text("search")
+        manager = AzureLoadTestFileManager(admin_client)
+        monkeypatch.setattr(manager, "_find_osdu_locustfile", Mock(return_value=["/pkg/locustfile.py"]))
+
+        found = manager.find_test_files(str(tmp_path))
+
+        assert found == [str(tmp_path / "perf_search_test.py"), "/pkg/locustfile.py"]
+
+    def test_similar_name_is_not_taken_for_locustfile(self, admin_client, tmp_path, monkeypatch):
+        (tmp_path / "my_locustfile.py").write_text("not the main script")
+        manager = AzureLoadTestFileManager(admin_client)
+        monkeypatch.setattr(manager, "_find_osdu_locustfile", Mock(return_value=["/pkg/locustfile.py"]))
+
+        assert manager.find_test_files(str(tmp_path))[-1] == "/pkg/locustfile.py"
+
+    def test_missing_directory_falls_back_to_packaged_locustfile(self, admin_client, tmp_path, monkeypatch):
+        manager = AzureLoadTestFileManager(admin_client)
+        monkeypatch.setattr(manager, "_find_osdu_locustfile", Mock(return_value=["/pkg/locustfile.py"]))
+
+        assert manager.find_test_files(str(tmp_path / "absent")) == ["/pkg/locustfile.py"]
@@ -0,0 +1,24 @@
+"""Unit tests for init_runner module."""
+import pytest
+
+from osdu_perf.operations.init_operation.init_runner import InitRunner
+
+
+class TestShouldCreateFile:
+    """Test cases for InitRunner._should_create_file."""
+
+    @pytest.fixture
+    def runner(self):
+        """Create InitRunner instance."""
+        return InitRunner()
+
+    @pytest.mark.parametrize("choice, exists, expected", [
+        ("o", True, True), ("o", False, True),
+        ("s", True, False), ("s", False, True),
+        ("b", True, True), ("b", False, True),
+        ("x", True, False), ("x", False, False),
+    ])
+    def test_should_create_file(self, runner, monkeypatch, choice, exists, expected):
+        """Test overwrite/skip/backup choices against existing and missing files."""
+        monkeypatch.setattr('os.path.exists', lambda _: exists)
+        assert runner._should_create_file("test.py", choice) is expected
@@ -0,0 +1,47 @@
+"""Unit tests for InputHandler Azure Load Test environment detection."""
+
+import os
+import pytest
+from unittest.mock import patch
+
+from osdu_perf.operations import input_handler
+from osdu_perf.operations.input_handler import _detect_azure_load_test_environment
+
+
+@pytest.fixture(autouse=True)
+def _clear_detection_cache():
+    """Reset the process-wide detection cache around every test."""
+    _detect_azure_load_test_environment.cache_clear()
+    yield
+    _detect_azure_load_test_environment.cache_clear()
+
+
+class TestDetectAzureLoadTestEnvironment:
+    """Tests for the memoized module-level detection helper."""
+
+    def test_local_environment(self):
+        """No Azure Load Test indicators means local development."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert _detect_azure_load_test_environment() is False
+
+    @pytest.mark.parametrize("var, value", [
+        ("AZURE_LOAD_TEST", "true"),
+        ("LOCUST_HOST", "https://example.com"),
+        ("LOCUST_USERS", "10"),
+        ("LOCUST_RUN_TIME", "60"),
+        ("LOCUST_SPAWN_RATE", "2"),
+    ])
+    def test_azure_indicators(self, var, value):
+        """Any Azure Load Test indicator is detected."""
+        with patch.dict(os.environ, {var: value}, clear=True):
+            assert _detect_azure_load_test_environment() is True
+
+    def test_result_is_computed_once(self):
+        """Later environment changes don't re-run detection or re-log."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert _detect_azure_load_test_environment() is False
+
+        with patch.dict(os.environ, {"AZURE_LOAD_TEST": "true"}, clear=True), \
+             patch.object(input_handler.logging, "getLogger") as mock_get_logger:
+            assert _detect_azure_load_test_environment() is False
+            mock_get_logger.assert_not_called()
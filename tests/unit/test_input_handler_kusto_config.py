@@ -13,11 +13,11 @@ MOCK_DEFAULTS = {
 
 def _make_input_handler(system_config=None):
     """Create an InputHandler in config-only mode with the given system_config."""
-    with patch("osdu_perf.operations.input_handler.InputHandler._load_split_configs") as mock_load:
-        mock_load.return_value = (system_config or {}, {})
-        with patch("osdu_perf.operations.input_handler.InputHandler._detect_azure_load_test_environment", return_value=False):
-            from osdu_perf.operations.input_handler import InputHandler
-            ih = InputHandler(environment=None)
+    with patch("osdu_perf.operations.input_handler.InputHandler._load_split_configs",
+               return_value=(system_config or {}, {})), \
+            patch("osdu_perf.operations.input_handler.InputHandler._detect_azure_load_test_environment", return_value=False):
+        from osdu_perf.operations.input_handler import InputHandler
+        ih = InputHandler(environment=None)
     return ih
 
 
@@ -31,7 +31,6 @@ def _patch_kusto_defaults():
 
     def patched_get_kusto_config(self):
         # Temporarily replace the default_config inside the method
-        import types
         # Call original but with patched defaults
         default_config = MOCK_DEFAULTS.copy()
 
@@ -0,0 +1,139 @@
+"""Unit tests for the Kusto telemetry plugin."""
+
+import csv
+import gzip
+import io
+import logging
+import tempfile
+from unittest.mock import Mock
+
+import pytest
+
+from osdu_perf.telemetry.plugins import kusto_plugin
+from osdu_perf.telemetry.plugins.kusto_plugin import (
+    KustoPlugin, _create_gzip_csv_file, _write_csv_rows,
+)
+
+
+class TestKustoPluginPublish:
+    """publish() ingests in the caller's thread and reports failures there."""
+
+    @pytest.fixture
+    def plugin(self):
+        plugin = KustoPlugin()
+        plugin.is_enabled({"kusto": {"cluster": "https://mycluster.kusto.windows.net"}})
+        return plugin
+
+    def test_publish_ingests_before_returning(self, plugin, monkeypatch):
+        impl = Mock()
+        monkeypatch.setattr(plugin, "_publish_impl", impl)
+        report = Mock()
+
+        plugin.publish(report)
+
+        impl.assert_called_once_with(report)
+
+    def test_publish_logs_ingest_failure(self, plugin, monkeypatch, caplog):
+        monkeypatch.setattr(plugin, "_publish_impl", Mock(side_effect=RuntimeError("ingest down")))
+
+        with caplog.at_level(logging.ERROR):
+            plugin.publish(Mock())
+
+        assert "Kusto plugin failed" in caplog.text
+        assert "ingest down" in caplog.text
+
+    def test_publish_logs_missing_sdk(self, plugin, monkeypatch, caplog):
+        monkeypatch.setattr(plugin, "_publish_impl", Mock(side_effect=ImportError("azure.kusto")))
+
+        with caplog.at_level(logging.ERROR):
+            plugin.publish(Mock())
+
+        assert "Kusto SDK not installed" in caplog.text
+
+
+class TestWriteCsvRows:
+    """_write_csv_rows writes rows in schema order like csv.DictWriter did."""
+
+    def test_rows_follow_column_order(self):
+        output = io.StringIO()
+        _write_csv_rows(output, [{"B": 2, "A": 1}, {"A": 3, "B": 4}], ["A", "B"])
+        assert output.getvalue().splitlines() == ["A,B", "1,2", "3,4"]
+
+    def test_single_column(self):
+        output = io.StringIO()
+        _write_csv_rows(output, [{"Name": "a,b"}, {"Name": "c"}], ["Name"])
+        assert output.getvalue().splitlines() == ["Name", '"a,b"', "c"]
+
+    def test_missing_key_becomes_empty_cell(self):
+        output = io.StringIO()
+        _write_csv_rows(output, [{"A": 1}], ["A", "B"])
+        assert output.getvalue().splitlines() == ["A,B", "1,"]
+
+
+class TestCreateGzipCsvFile:
+    """_create_gzip_csv_file writes a gzip CSV temp file and cleans up on failure."""
+
+    @pytest.fixture(autouse=True)
+    def _tempdir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    def test_file_round_trips(self, tmp_path):
+        path = _create_gzip_csv_file([{"A": 1, "B": "x"}, {"A": 2, "B": "y"}], ["A", "B"])
+
+        assert path.startswith(str(tmp_path))
+        assert path.endswith(".csv.gz")
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as fh:
+            assert list(csv.reader(fh)) == [["A", "B"], ["1", "x"], ["2", "y"]]
+
+    def test_failed_write_removes_file(self, tmp_path):
+        with pytest.raises(AttributeError):
+            _create_gzip_csv_file([None], ["A"])
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestIngestRows:
+    """_ingest_rows hands one file to the ingest client and always deletes it."""
+
+    @pytest.fixture
+    def created_paths(self, tmp_path, monkeypatch):
+        pytest.importorskip("azure.kusto.ingest")
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        paths = []
+
+        def _create(data_list, columns):
+            paths.append(_create_gzip_csv_file(data_list, columns))
+            return paths[-1]
+
+        monkeypatch.setattr(kusto_plugin, "_create_gzip_csv_file", _create)
+        return paths
+
+    def _ingest(self, ingest_client):
+        from azure.kusto.data import DataFormat
+        KustoPlugin()._ingest_rows(
+            ingest_client, [{"TestRunId": "run-1"}], [("TestRunId", "string")],
+            "LocustTestSummaryV3", "perf-db", DataFormat.CSV, False,
+        )
+
+    def test_success_ingests_and_removes_file(self, created_paths, tmp_path):
+        ingest_client = Mock()
+
+        self._ingest(ingest_client)
+
+        ingest_client.ingest_from_file.assert_called_once()
+        descriptor, properties = ingest_client.ingest_from_file.call_args.args
+        assert descriptor.path == created_paths[0]
+        assert properties.database == "perf-db"
+        assert properties.table == "LocustTestSummaryV3"
+        assert properties.flush_immediately is False
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_ingest_removes_file(self, created_paths, tmp_path):
+        ingest_client = Mock()
+        ingest_client.ingest_from_file.side_effect = RuntimeError("queue unavailable")
+
+        with pytest.raises(RuntimeError, match="queue unavailable"):
+            self._ingest(ingest_client)
+
+        assert len(created_paths) == 1
+        assert list(tmp_path.iterdir()) == []
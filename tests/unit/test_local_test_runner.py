@@ -0,0 +1,62 @@
+"""Unit tests for local_test_runner module."""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from osdu_perf.operations.local_test_operation import local_test_runner
+from osdu_perf.operations.local_test_operation.local_test_runner import LocalTestRunner
+
+
+class TestExecuteLocustCommand:
+    """Test cases for LocalTestRunner.execute_locust_command."""
+
+    @pytest.fixture
+    def runner(self):
+        """Create LocalTestRunner with a mock logger."""
+        return LocalTestRunner(logger=Mock())
+
+    def test_returns_locust_exit_code(self, runner):
+        """Test the locust process exit code is returned and env is passed through."""
+        runner._run = Mock(return_value=SimpleNamespace(returncode=3))
+
+        assert runner.execute_locust_command(["locust", "-f", "locustfile.py"], {"HOST": "h"}) == 3
+        runner._run.assert_called_once_with(["locust", "-f", "locustfile.py"],
+                                            capture_output=False, text=True, env={"HOST": "h"})
+
+    @pytest.mark.parametrize("error, message", [
+        (FileNotFoundError(), "Locust is not installed"),
+        (RuntimeError("boom"), "Error running locust command: boom"),
+    ])
+    def test_launch_failure_returns_one(self, runner, error, message):
+        """Test launch failures are logged and reported as exit code 1."""
+        runner._run = Mock(side_effect=error)
+
+        assert runner.execute_locust_command(["locust"], {}) == 1
+        assert message in runner.logger.error.call_args.args[0]
+
+
+class TestBuildLocustCommand:
+    """Test cases for LocalTestRunner.build_locust_command."""
+
+    @staticmethod
+    def _config(run_time="60s", tags=""):
+        # Referenced via the module so pytest doesn't try to collect the dataclass
+        return local_test_runner.TestConfiguration(host="https://test-host.com", partition="p", app_id="a", token=None,
+                                                   test_run_id="run-1", users=10, spawn_rate=2, run_time=run_time, tags=tags)
+
+    @pytest.mark.parametrize("run_time", ["60s", "5m", "1h", "30", "10m30s"])
+    def test_run_time_passed_through(self, run_time):
+        """Test each run time format reaches locust unchanged."""
+        command = LocalTestRunner(logger=Mock()).build_locust_command(
+            SimpleNamespace(), "locustfile.py", self._config(run_time=run_time))
+        assert command[command.index("--run-time") + 1] == run_time
+
+    def test_tags_and_headless_flags(self):
+        """Test tags and --headless are only added when requested."""
+        runner = LocalTestRunner(logger=Mock())
+        plain = runner.build_locust_command(SimpleNamespace(), "locustfile.py", self._config())
+        tagged = runner.build_locust_command(SimpleNamespace(headless=True), "locustfile.py", self._config(tags="smoke"))
+
+        assert "--tags" not in plain and "--headless" not in plain
+        assert tagged[-3:] == ["--tags", "smoke", "--headless"]
@@ -1,277 +1,117 @@
 """
 Test cases for main CLI entry point.
 """
+import importlib
 import pytest
 import os
 import sys
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from osdu_perf.cli.main import main
 
+# osdu_perf.cli re-exports main(), which shadows the submodule as an attribute,
+# so fetch the module itself for monkeypatching.
+cli_main = importlib.import_module('osdu_perf.cli.main')
+
+
+@pytest.fixture
+def main_patches(monkeypatch):
+    """Swap get_logger, CommandRegistry and sys.exit in cli.main for Mocks."""
+    mock_get_logger, mock_registry_class, mock_sys_exit = Mock(), Mock(), Mock()
+    monkeypatch.setattr(cli_main, 'get_logger', mock_get_logger)
+    monkeypatch.setattr(cli_main, 'CommandRegistry', mock_registry_class)
+    monkeypatch.setattr(cli_main.sys, 'exit', mock_sys_exit)
+    return mock_get_logger, mock_registry_class, mock_sys_exit
+
+
+@pytest.fixture
+def cli_run(main_patches):
+    """Wire the patched registry to a parser and a 'version' command that succeeds."""
+    mock_get_logger, mock_registry_class, mock_sys_exit = main_patches
+    logger, parser, command, registry = Mock(), Mock(), Mock(), Mock()
+    args = SimpleNamespace(command='version')
+    mock_get_logger.return_value = logger
+    parser.parse_args.return_value = args
+    command.execute.return_value = 0
+    registry.build_parser.return_value = parser
+    registry.resolve.return_value = command
+    mock_registry_class.return_value = registry
+    return SimpleNamespace(get_logger=mock_get_logger, logger=logger, parser=parser, args=args,
+                           command=command, registry=registry, sys_exit=mock_sys_exit)
+
 
 class TestMain:
     """Test cases for main CLI function."""
     
-    @patch('osdu_perf.cli.main.sys.exit')
-    @patch('osdu_perf.cli.main.CommandRegistry')
-    @patch('osdu_perf.cli.main.get_logger')
-    def test_main_successful_execution(self, mock_get_logger, mock_registry_class, mock_sys_exit):
+    def test_main_successful_execution(self, cli_run):
         """Test successful main execution."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-        
-        mock_parser = Mock()
-        mock_args = Mock()
-        mock_args.command = 'version'
-        mock_parser.parse_args.return_value = mock_args
-        
-        mock_command = Mock()
-        mock_command.execute.return_value = 0
-        
-        mock_registry = Mock()
-        mock_registry.build_parser.return_value = mock_parser
-        mock_registry.resolve.return_value = mock_command
-        mock_registry_class.return_value = mock_registry
-        
         main()
         
         assert os.environ['GEVENT_SUPPORT'] == 'False'
         assert os.environ['NO_GEVENT_MONKEY_PATCH'] == '1'
-        mock_get_logger.assert_called_once_with('CLI')
-        mock_registry.build_parser.assert_called_once()
-        mock_parser.parse_args.assert_called_once()
-        mock_registry.resolve.assert_called_once_with(mock_args)
-        mock_command.execute.assert_called_once_with(mock_args)
-        mock_sys_exit.assert_not_called()
+        cli_run.get_logger.assert_called_once_with('CLI')
+        cli_run.registry.build_parser.assert_called_once()
+        cli_run.parser.parse_args.assert_called_once()
+        cli_run.registry.resolve.assert_called_once_with(cli_run.args)
+        cli_run.command.execute.assert_called_once_with(cli_run.args)
+        cli_run.sys_exit.assert_not_called()
     
-    @patch('osdu_perf.cli.main.sys.exit')
-    @patch('osdu_perf.cli.main.CommandRegistry')
-    @patch('osdu_perf.cli.main.get_logger')
-    def test_main_no_command_resolve_exits(self, mock_get_logger, mock_registry_class, mock_sys_exit):
+    def test_main_no_command_resolve_exits(self, cli_run):
         """Test main raises SystemExit when resolve() finds no command."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-        
-        mock_parser = Mock()
-        mock_args = Mock()
-        mock_args.command = None
-        mock_parser.parse_args.return_value = mock_args
-        
-        mock_registry = Mock()
-        mock_registry.build_parser.return_value = mock_parser
-        mock_registry.resolve.side_effect = SystemExit(
+        cli_run.args.command = None
+        cli_run.registry.resolve.side_effect = SystemExit(
             "No command resolved. Run with --help to see available commands."
         )
-        mock_registry_class.return_value = mock_registry
         
         with pytest.raises(SystemExit):
             main()
     
-    @patch('osdu_perf.cli.main.sys.exit')
-    @patch('osdu_perf.cli.main.CommandRegistry')
-    @patch('osdu_perf.cli.main.get_logger')
-    def test_main_run_command_with_subcommand(self, mock_get_logger, mock_registry_class, mock_sys_exit):
-        """Test main with run command and subcommand."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-        
-        mock_parser = Mock()
-        mock_args = Mock()
-        mock_args.command = 'run'
-        mock_parser.parse_args.return_value = mock_args
-        
-        mock_command = Mock()
-        mock_command.execute.return_value = 0
-        
-        mock_registry = Mock()
-        mock_registry.build_parser.return_value = mock_parser
-        mock_registry.resolve.return_value = mock_command
-        mock_registry_class.return_value = mock_registry
-        
-        main()
-        
-        mock_registry.resolve.assert_called_once_with(mock_args)
-        mock_command.execute.assert_called_once_with(mock_args)
-        mock_sys_exit.assert_not_called()
-    
-    @patch('osdu_perf.cli.main.sys.exit')
-    @patch('osdu_perf.cli.main.CommandRegistry')
-    @patch('osdu_perf.cli.main.get_logger')
-    def test_main_run_command_azure_subcommand(self, mock_get_logger, mock_registry_class, mock_sys_exit):
-        """Test main with run command and azure subcommand."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-        
-        mock_parser = Mock()
-        mock_args = Mock()
-        mock_args.command = 'run'
-        mock_parser.parse_args.return_value = mock_args
-        
-        mock_command = Mock()
-        mock_command.execute.return_value = 0
-        
-        mock_registry = Mock()
-        mock_registry.build_parser.return_value = mock_parser
-        mock_registry.resolve.return_value = mock_command
-        mock_registry_class.return_value = mock_registry
-        
-        main()
-        
-        mock_registry.resolve.assert_called_once_with(mock_args)
-        mock_command.execute.assert_called_once_with(mock_args)
-        mock_sys_exit.assert_not_called()
-    
-    @patch('osdu_perf.cli.main.sys.exit')
-    @patch('osdu_perf.cli.main.CommandRegistry')
-    @patch('osdu_perf.cli.main.get_logger')
-    def test_main_init_command(self, mock_get_logger, mock_registry_class, mock_sys_exit):
-        """Test main with init command."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-        
-        mock_parser = Mock()
-        mock_args = Mock()
-        mock_args.command = 'init'
-        mock_parser.parse_args.return_value = mock_args
-        
-        mock_command = Mock()
-        mock_command.execute.return_value = 0
-        
-        mock_registry = Mock()
-        mock_registry.build_parser.return_value = mock_parser
-        mock_registry.resolve.return_value = mock_command
-        mock_registry_class.return_value = mock_registry
-        
-        main()
-        
-        mock_registry.resolve.assert_called_once_with(mock_args)
-        mock_command.execute.assert_called_once_with(mock_args)
-        mock_sys_exit.assert_not_called()
-    
-    @patch('osdu_perf.cli.main.sys.exit')
-    @patch('osdu_perf.cli.main.CommandRegistry')
-    @patch('osdu_perf.cli.main.get_logger')
-    def test_main_command_failure_exits(self, mock_get_logger, mock_registry_class, mock_sys_exit):
-        """Test main exits when command fails."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-        
-        mock_parser = Mock()
-        mock_args = Mock()
-        mock_args.command = 'version'
-        mock_parser.parse_args.return_value = mock_args
-        
-        mock_command = Mock()
-        mock_command.execute.return_value = 1
-        
-        mock_registry = Mock()
-        mock_registry.build_parser.return_value = mock_parser
-        mock_registry.resolve.return_value = mock_command
-        mock_registry_class.return_value = mock_registry
+    @pytest.mark.parametrize("command", ["run", "init"])
+    def test_main_dispatches_command(self, cli_run, command):
+        """Test main resolves and executes the parsed command."""
+        cli_run.args.command = command
         
         main()
         
-        mock_sys_exit.assert_called_once_with(1)
+        cli_run.registry.resolve.assert_called_once_with(cli_run.args)
+        cli_run.command.execute.assert_called_once_with(cli_run.args)
+        cli_run.sys_exit.assert_not_called()
     
-    @patch('osdu_perf.cli.main.sys.exit')
-    @patch('osdu_perf.cli.main.CommandRegistry')
-    @patch('osdu_perf.cli.main.get_logger')
-    def test_main_command_failure_different_exit_codes(self, mock_get_logger, mock_registry_class, mock_sys_exit):
-        """Test main handles different exit codes."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-        
-        mock_parser = Mock()
-        mock_args = Mock()
-        mock_args.command = 'init'
-        mock_parser.parse_args.return_value = mock_args
-        
-        mock_command = Mock()
-        mock_command.execute.return_value = 2
-        
-        mock_registry = Mock()
-        mock_registry.build_parser.return_value = mock_parser
-        mock_registry.resolve.return_value = mock_command
-        mock_registry_class.return_value = mock_registry
+    @pytest.mark.parametrize("command, exit_code", [("version", 1), ("init", 2)])
+    def test_main_command_failure_exits(self, cli_run, command, exit_code):
+        """Test main exits with the failing command's exit code."""
+        cli_run.args.command = command
+        cli_run.command.execute.return_value = exit_code
         
         main()
         
-        mock_sys_exit.assert_called_once_with(2)
+        cli_run.sys_exit.assert_called_once_with(exit_code)
     
-    @patch('osdu_perf.cli.main.get_logger')
-    def test_main_sets_environment_variables(self, mock_get_logger):
+    def test_main_sets_environment_variables(self, cli_run, monkeypatch):
         """Test that main sets required environment variables."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-        
-        if 'GEVENT_SUPPORT' in os.environ:
-            del os.environ['GEVENT_SUPPORT']
-        if 'NO_GEVENT_MONKEY_PATCH' in os.environ:
-            del os.environ['NO_GEVENT_MONKEY_PATCH']
+        monkeypatch.delenv('GEVENT_SUPPORT', raising=False)
+        monkeypatch.delenv('NO_GEVENT_MONKEY_PATCH', raising=False)
         
-        with patch('osdu_perf.cli.main.CommandRegistry') as mock_registry_class:
-            mock_parser = Mock()
-            mock_args = Mock()
-            mock_args.command = 'version'
-            mock_parser.parse_args.return_value = mock_args
-            
-            mock_command = Mock()
-            mock_command.execute.return_value = 0
-            
-            mock_registry = Mock()
-            mock_registry.build_parser.return_value = mock_parser
-            mock_registry.resolve.return_value = mock_command
-            mock_registry_class.return_value = mock_registry
-            
-            main()
+        main()
         
         assert os.environ['GEVENT_SUPPORT'] == 'False'
         assert os.environ['NO_GEVENT_MONKEY_PATCH'] == '1'
-        mock_logger.debug.assert_called_once_with("disable gevent monkey patch: 1")
+        cli_run.logger.debug.assert_called_once_with("disable gevent monkey patch: 1")
     
-    @patch('osdu_perf.cli.main.sys.exit')
-    @patch('osdu_perf.cli.main.CommandRegistry')
-    @patch('osdu_perf.cli.main.get_logger')
-    def test_main_zero_exit_code_no_exit(self, mock_get_logger, mock_registry_class, mock_sys_exit):
+    def test_main_zero_exit_code_no_exit(self, cli_run):
         """Test that zero exit code doesn't call sys.exit."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-        
-        mock_parser = Mock()
-        mock_args = Mock()
-        mock_args.command = 'version'
-        mock_parser.parse_args.return_value = mock_args
-        
-        mock_command = Mock()
-        mock_command.execute.return_value = 0
-        
-        mock_registry = Mock()
-        mock_registry.build_parser.return_value = mock_parser
-        mock_registry.resolve.return_value = mock_command
-        mock_registry_class.return_value = mock_registry
-        
         main()
         
-        mock_sys_exit.assert_not_called()
+        cli_run.sys_exit.assert_not_called()
 
 
 class TestMainAsScript:
     """Test cases for running main as a script."""
     
-    def test_main_function_exists_and_callable(self):
+    def test_main_function_exists_and_callable(self, cli_run):
         """Test that main function exists and is callable."""
-        from osdu_perf.cli.main import main
-        
         assert callable(main)
         
-        with patch('osdu_perf.cli.main.sys.exit'):
-            with patch('osdu_perf.cli.main.CommandRegistry') as mock_registry_class:
-                mock_parser = Mock()
-                mock_args = Mock()
-                mock_args.command = None
-                mock_parser.parse_args.return_value = mock_args
-                
-                mock_registry = Mock()
-                mock_registry.build_parser.return_value = mock_parser
-                mock_registry_class.return_value = mock_registry
-                
-                main()
\ No newline at end of file
+        cli_run.args.command = None
+        
+        main()
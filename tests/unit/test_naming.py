@@ -0,0 +1,51 @@
+"""Unit tests for the telemetry host and service name parsers."""
+
+from urllib.parse import urlparse
+
+import pytest
+
+from osdu_perf.telemetry.naming import get_adme_name, get_service_name
+
+
+class TestGetAdmeName:
+    """get_adme_name returns the host name of each Locust host URL."""
+
+    @pytest.mark.parametrize("host, expected", [
+        ("https://adme.energy.azure.com", "adme.energy.azure.com"),
+        ("https://adme.energy.azure.com:8443/", "adme.energy.azure.com"),
+        ("https://other.energy.azure.com", "other.energy.azure.com"),
+    ])
+    def test_host_without_port(self, host, expected):
+        assert get_adme_name(host) == expected
+        assert get_adme_name(host) == expected
+
+
+class TestGetServiceName:
+    """get_service_name matches the urlparse-based parser it replaced."""
+
+    @staticmethod
+    def _urlparse_service_name(url_path):
+        try:
+            return urlparse(url_path).path.split('/')[2] or "unknown"
+        except Exception:
+            return "unknown"
+
+    @pytest.mark.parametrize("url_path, expected", [
+        ("/api/search/v2/query", "search"),
+        ("/api/storage/v2/records/abc?limit=10", "storage"),
+        ("/api/search?q=1", "search"),
+        ("/api/search#top", "search"),
+        ("/api/search;v=1", "search"),
+        ("/api/search;v=1/v2", "search;v=1"),
+        ("/api/x?next=http://other/api/y", "x"),
+        ("https://host.example.com/api/legal/v1/legaltags", "legal"),
+        ("//host.example.com/api/entitlements/v2", "entitlements"),
+        ("https://host.example.com", "unknown"),
+        ("/api//v2", "unknown"),
+        ("/health", "unknown"),
+        ("search_query", "unknown"),
+        ("", "unknown"),
+    ])
+    def test_matches_urlparse(self, url_path, expected):
+        assert get_service_name(url_path) == expected
+        assert get_service_name(url_path) == self._urlparse_service_name(url_path)
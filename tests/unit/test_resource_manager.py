@@ -0,0 +1,43 @@
+"""Unit tests for AzureLoadTestResourceManager."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from osdu_perf.operations.azure_test_operation.resource_manager import AzureLoadTestResourceManager
+
+
+@pytest.fixture
+def resource_manager(monkeypatch):
+    """Resource manager with mocked ARM clients."""
+    monkeypatch.setattr(AzureLoadTestResourceManager, "_init_clients", lambda self: None)
+    manager = AzureLoadTestResourceManager(
+        subscription_id="sub-1",
+        resource_group_name="rg-1",
+        load_test_name="lt-1",
+        location="eastus",
+        credential=Mock(),
+        poll_interval=2,
+    )
+    manager.loadtest_mgmt_client = Mock()
+    monkeypatch.setattr(manager, "create_resource_group", Mock())
+    return manager
+
+
+class TestCreateLoadTestResource:
+    """create_load_test_resource polls resource creation at poll_interval."""
+
+    def test_existing_resource_is_not_created(self, resource_manager):
+        resource_manager.create_load_test_resource()
+
+        resource_manager.loadtest_mgmt_client.load_tests.begin_create_or_update.assert_not_called()
+
+    def test_create_passes_polling_interval(self, resource_manager):
+        load_tests = resource_manager.loadtest_mgmt_client.load_tests
+        load_tests.get.side_effect = Exception("ResourceNotFound")
+
+        result = resource_manager.create_load_test_resource()
+
+        mock_create = load_tests.begin_create_or_update
+        assert mock_create.call_args.kwargs["polling_interval"] == 2
+        assert result == mock_create.return_value.result.return_value.as_dict.return_value
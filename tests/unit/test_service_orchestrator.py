@@ -1,12 +1,10 @@
 """Unit tests for service_orchestrator module."""
 import pytest
-import os
-import tempfile
-import shutil
 from unittest.mock import Mock, patch, MagicMock
 import importlib.util
+from pathlib import Path
 
-from osdu_perf.operations.service_orchestrator import ServiceOrchestrator
+from osdu_perf.operations.service_orchestrator import ServiceOrchestrator, _parse_service_name
 from osdu_perf.operations.base_service import BaseService
 
 
@@ -54,19 +52,10 @@ class TestServiceOrchestrator:
         return ServiceOrchestrator()
     
     @pytest.fixture
-    def mock_client(self):
-        """Mock HTTP client."""
-        return Mock()
-    
-    @pytest.fixture
-    def temp_directory(self):
-        """Create temporary directory for test files."""
-        temp_dir = tempfile.mkdtemp()
-        original_cwd = os.getcwd()
-        os.chdir(temp_dir)
-        yield temp_dir
-        os.chdir(original_cwd)
-        shutil.rmtree(temp_dir)
+    def temp_directory(self, tmp_path, monkeypatch):
+        """Make pytest's per-test tmp_path the CWD for test files."""
+        monkeypatch.chdir(tmp_path)
+        return str(tmp_path)
     
     def test_orchestrator_initialization(self, orchestrator):
         """Test ServiceOrchestrator initialization."""
@@ -136,35 +125,47 @@ class TestServiceOrchestrator:
         found_service = orchestrator.find_service("any_name")
         assert found_service is None
     
-    @patch('builtins.print')
-    def test_register_service_sample_no_services_folder(self, mock_print, orchestrator, mock_client, temp_directory):
+    @pytest.mark.xdist_group(name="cwd")
+    def test_register_service_sample_no_services_folder(self, orchestrator, mock_client, temp_directory, capsys):
         """Test register_service_sample when services folder doesn't exist."""
         orchestrator.register_service_sample(mock_client)
         
         # Should print error messages about missing services folder
-        assert any("Services folder not found" in str(call) for call in mock_print.call_args_list)
+        assert "Services folder not found" in capsys.readouterr().out
     
-    @patch('builtins.print')
-    def test_register_service_sample_empty_services_folder(self, mock_print, orchestrator, mock_client, temp_directory):
+    @pytest.mark.xdist_group(name="cwd")
+    def test_register_service_sample_empty_services_folder(self, orchestrator, mock_client, temp_directory, capsys):
         """Test register_service_sample with empty services folder."""
         # Create empty services folder
-        os.makedirs("services")
+        Path(temp_directory, "services").mkdir()
         
         orchestrator.register_service_sample(mock_client)
         
         # Should complete without errors but no services registered
         assert len(orchestrator._services) == 0
+        assert "Total services registered: 0" in capsys.readouterr().out
     
-    @patch('builtins.print')
-    def test_register_service_no_test_files(self, mock_print, orchestrator, mock_client, temp_directory):
+    @pytest.mark.xdist_group(name="cwd")
+    def test_register_service_no_test_files(self, orchestrator, mock_client, temp_directory, capsys):
         """Test register_service when no perf_*_test.py files exist."""
         orchestrator.register_service(mock_client)
         
         # Should print message about no test files found
-        assert any("No perf_*_test.py files found" in str(call) for call in mock_print.call_args_list)
+        assert "No perf_*_test.py files found" in capsys.readouterr().out
     
-    @patch('builtins.print')
-    def test_register_service_with_test_files(self, mock_print, orchestrator, mock_client, temp_directory):
+    @pytest.mark.parametrize("file_name, expected", [
+        ("perf_storage_test.py", "storage"),
+        ("perf_search_v2_test.py", "search_v2"),
+        ("perf_test.py", None),
+        ("storage_test.py", None),
+        ("perf_storage_test.pyc", None),
+    ])
+    def test_parse_service_name_from_filename(self, file_name, expected):
+        """Test the service name is parsed from perf_<service>_test.py names."""
+        assert _parse_service_name(file_name) == expected
+    
+    @pytest.mark.xdist_group(name="cwd")
+    def test_register_service_with_test_files(self, orchestrator, mock_client, temp_directory):
         """Test register_service with valid test files."""
         # Create a test file with a service class
         test_content = '''
@@ -207,8 +208,8 @@ class StoragePerformanceTest(BaseService):
             
             orchestrator.register_service(mock_client)
     
-    @patch('builtins.print')
-    def test_register_service_import_error(self, mock_print, orchestrator, mock_client, temp_directory):
+    @pytest.mark.xdist_group(name="cwd")
+    def test_register_service_import_error(self, orchestrator, mock_client, temp_directory, capsys):
         """Test register_service with import errors."""
         # Create a test file with syntax error
         with open("perf_broken_test.py", "w") as f:
@@ -218,7 +219,7 @@ class StoragePerformanceTest(BaseService):
             orchestrator.register_service(mock_client)
         
         # Should print error message
-        assert any("Failed to load test module" in str(call) for call in mock_print.call_args_list)
+        assert "Failed to load test module" in capsys.readouterr().out
     
     def test_get_services_with_multiple_services(self, orchestrator, mock_client):
         """Test get_services with multiple registered services."""
@@ -232,8 +233,17 @@ class StoragePerformanceTest(BaseService):
         assert service1 in services
         assert service2 in services
     
-    @patch('builtins.print')
-    def test_duplicate_service_registration(self, mock_print, orchestrator, mock_client):
+    def test_get_services_returns_list(self, orchestrator, mock_client):
+        """Test get_services returns the registered services as a list."""
+        service1 = self.TestService1(mock_client)
+        orchestrator._services.append(service1)
+        
+        assert orchestrator.get_services() == [service1]
+        
+        orchestrator.unregister_service(service1)
+        assert orchestrator.get_services() == []
+    
+    def test_duplicate_service_registration(self, orchestrator, mock_client):
         """Test that duplicate services are not registered."""
         service1 = self.TestService1(mock_client)
         
@@ -253,4 +263,4 @@ class StoragePerformanceTest(BaseService):
         else:
             orchestrator._services.pop()  # Remove the duplicate we just added
         
-        assert len(orchestrator._services) == initial_count - 1
\ No newline at end of file
+        assert len(orchestrator._services) == initial_count - 1
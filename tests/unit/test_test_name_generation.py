@@ -1,6 +1,8 @@
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pytest
+
 from osdu_perf.cli.commands.run_azure_command import AzureLoadTestCommand
 from osdu_perf.operations.input_handler import InputHandler
 from osdu_perf.operations.local_test_operation.local_test_runner import LocalTestRunner
@@ -21,23 +23,29 @@ def test_input_handler_generate_test_name_normalizes_values():
     assert test_run_id.startswith("My.Prefix_Premium_1_2_")
 
 
-def test_local_runner_uses_shared_test_name_generation_for_run_id():
-    logger = Mock()
-    runner = LocalTestRunner(logger=logger)
+def test_input_handler_run_id_uses_shared_timestamp():
+    handler = InputHandler.__new__(InputHandler)
+    handler.get_test_name_prefix = Mock(return_value="prefix")
+    handler.logger = Mock()
+    handler._clock = lambda fmt, utc=False: "20250924_152250"
 
-    input_handler = Mock()
-    input_handler.validate_scenario.return_value = "scenario_1"
-    input_handler.get_users.return_value = 10
-    input_handler.get_spawn_rate.return_value = 2
-    input_handler.get_run_time.return_value = "60s"
-    input_handler.get_osdu_performance_tier.return_value = "standard"
-    input_handler.get_osdu_version.return_value = "1.0"
-    input_handler.get_test_scenario.return_value = "scenario_1"
-    input_handler.generate_test_name_and_run_id.return_value = (
-        "team_prefix",
-        "team_prefix_20260417_120000",
-    )
-    input_handler.resolve_test_execution_settings.return_value = {
+    _, test_run_id = InputHandler.generate_test_name_and_run_id(handler, performance_tier="", version="")
+
+    assert test_run_id == "prefix_20250924_152250"
+
+
+@pytest.fixture
+def input_handler():
+    """InputHandler mock with the scenario/tier/version settings both runners read."""
+    handler = Mock()
+    handler.validate_scenario.return_value = "scenario_1"
+    handler.get_users.return_value = 10
+    handler.get_spawn_rate.return_value = 2
+    handler.get_run_time.return_value = "60s"
+    handler.get_osdu_performance_tier.return_value = "standard"
+    handler.get_osdu_version.return_value = "1.0"
+    handler.get_test_scenario.return_value = "scenario_1"
+    handler.resolve_test_execution_settings.return_value = {
         "scenario": "scenario_1",
         "tags": "scenario_1",
         "users": 10,
@@ -45,6 +53,17 @@ def test_local_runner_uses_shared_test_name_generation_for_run_id():
         "run_time": "60s",
         "engine_instances": 1,
     }
+    return handler
+
+
+def test_local_runner_uses_shared_test_name_generation_for_run_id(input_handler):
+    logger = Mock()
+    runner = LocalTestRunner(logger=logger)
+
+    input_handler.generate_test_name_and_run_id.return_value = (
+        "team_prefix",
+        "team_prefix_20260417_120000",
+    )
 
     runner._input_handler = input_handler
     runner._get_input_handler = Mock(return_value=input_handler)
@@ -72,36 +91,20 @@ def test_local_runner_uses_shared_test_name_generation_for_run_id():
 
 
 @patch("osdu_perf.operations.input_handler.InputHandler")
-def test_azure_command_uses_shared_test_name_generation(mock_input_handler_class):
-    input_handler = Mock()
+def test_azure_command_uses_shared_test_name_generation(mock_input_handler_class, input_handler):
     mock_input_handler_class.return_value = input_handler
 
     input_handler.get_osdu_host.return_value = "https://example"
     input_handler.get_osdu_partition.return_value = "opendes"
     input_handler.get_osdu_app_id.return_value = "app-id"
-    input_handler.get_osdu_performance_tier.return_value = "standard"
-    input_handler.get_osdu_version.return_value = "1.0"
     input_handler.get_azure_subscription_id.return_value = "sub-id"
     input_handler.get_azure_resource_group.return_value = "rg"
     input_handler.get_azure_location.return_value = "eastus"
-    input_handler.validate_scenario.return_value = "scenario_1"
-    input_handler.get_users.return_value = 10
-    input_handler.get_spawn_rate.return_value = 2
-    input_handler.get_run_time.return_value = "60s"
     input_handler.get_engine_instances.return_value = 1
     input_handler.generate_test_name_and_run_id.return_value = (
         "team_prefix_standard_1_0",
         "team_prefix_standard_1_0_20260417_120000",
     )
-    input_handler.resolve_test_execution_settings.return_value = {
-        "scenario": "scenario_1",
-        "tags": "scenario_1",
-        "users": 10,
-        "spawn_rate": 2,
-        "run_time": "60s",
-        "engine_instances": 1,
-    }
-    input_handler.get_test_scenario.return_value = "scenario_1"
     input_handler.get_test_run_id_description.return_value = "desc"
     input_handler.get_test_run_name.return_value = "team_prefix_standard-0417_120000"
 
@@ -0,0 +1,45 @@
+"""Unit tests for TokenCachingCredential."""
+import time
+from unittest.mock import Mock
+
+from osdu_perf.operations.auth import TokenCachingCredential
+
+
+def _access_token(value, expires_in):
+    return Mock(token=value, expires_on=time.time() + expires_in)
+
+
+class TestTokenCachingCredential:
+    """Test cases for TokenCachingCredential."""
+
+    def test_reuses_token_until_near_expiry(self):
+        """A valid token is fetched once per scope."""
+        inner = Mock()
+        inner.get_token.return_value = _access_token("t1", 3600)
+        credential = TokenCachingCredential(inner)
+
+        first = credential.get_token("https://management.azure.com/.default")
+        second = credential.get_token("https://management.azure.com/.default")
+
+        assert first is second
+        inner.get_token.assert_called_once_with("https://management.azure.com/.default")
+
+    def test_refreshes_token_inside_margin(self):
+        """A token expiring within the refresh margin is re-fetched."""
+        inner = Mock()
+        inner.get_token.side_effect = [_access_token("old", 60), _access_token("new", 3600)]
+        credential = TokenCachingCredential(inner)
+
+        credential.get_token("scope")
+        assert credential.get_token("scope").token == "new"
+        assert inner.get_token.call_count == 2
+
+    def test_scopes_are_cached_separately(self):
+        """Different scopes get their own tokens."""
+        inner = Mock()
+        inner.get_token.side_effect = lambda *scopes, **kwargs: _access_token(scopes[0], 3600)
+        credential = TokenCachingCredential(inner)
+
+        assert credential.get_token("a").token == "a"
+        assert credential.get_token("b").token == "b"
+        assert inner.get_token.call_count == 2